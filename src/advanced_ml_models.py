@@ -14,13 +14,10 @@ import numpy as np
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.metrics import mean_absolute_error, mean_squared_error
+from sklearn.metrics import mean_absolute_error
 import joblib
-import requests
-import re
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
-from textblob import TextBlob
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -453,6 +453,17 @@ class FPLDataFetcher:
         logger.info(f"Saving latest processed data to: {latest_filepath}")
         df.to_csv(latest_filepath, index=False)
         
+        # Parquet copy of the latest data for the web app (typed columns, no text parsing on load)
+        parquet_filepath = os.path.join(self.processed_data_dir, "fpl_players_latest.parquet")
+        try:
+            df.to_parquet(parquet_filepath, index=False)
+            logger.info(f"Saved latest processed data as Parquet to: {parquet_filepath}")
+        except Exception as e:
+            logger.warning(f"Could not save Parquet copy ({e}); the web app will read the CSV")
+            # Remove any older copy so it can never be mistaken for the data just saved
+            if os.path.exists(parquet_filepath):
+                os.remove(parquet_filepath)
+        
         logger.info(f"Processed data saved successfully to {filepath}")
         logger.info(f"Data shape: {df.shape}")
         logger.info(f"Columns: {list(df.columns)}")
@@ -31,6 +31,14 @@ logger = logging.getLogger(__name__)
 class FPLOptimizer:
     """Optimizes FPL squad selection using linear programming"""
     
+    # Features used in basic model training
+    FEATURE_COLUMNS = [
+        'form', 'cost', 'minutes', 'total_points', 'points_per_game',
+        'influence', 'creativity', 'threat', 'ict_index',
+        'selected_by_percent', 'minutes_per_game', 'cost_efficiency',
+        'position_encoded'
+    ]
+    
     def __init__(self, budget=100.0, model_path="models/model.pkl", min_budget_usage=0.99):
         self.budget = budget
         self.min_budget_usage = min_budget_usage  # Use at least 99% of budget
@@ -83,8 +91,14 @@ class FPLOptimizer:
         # Manual player selection
         self.manually_selected_players = []  # List of player IDs to force include
         
+        # CBC solver options (silent, presolve on, multithreaded branch-and-cut)
+        self.solver_options = {'msg': False, 'presolve': True, 'threads': min(4, os.cpu_count() or 1)}
+        
     def load_model(self):
-        """Load the trained prediction model (basic or advanced)"""
+        """Load the trained prediction model (basic or advanced); a no-op once loaded"""
+        if self.advanced_models_loaded or self.model is not None:
+            return
+        
         try:
             # Try to load advanced models first
             if self.use_advanced_models and self.ensemble_predictor:
@@ -126,23 +140,12 @@ class FPLOptimizer:
         # Method 2: Basic trained model
         elif self.model is not None:
             try:
-                # Features used in model training
-                feature_columns = [
-                    'form', 'cost', 'minutes', 'total_points', 'points_per_game',
-                    'influence', 'creativity', 'threat', 'ict_index',
-                    'selected_by_percent', 'minutes_per_game', 'cost_efficiency',
-                    'position_encoded'
-                ]
-                
                 # Ensure all feature columns exist
-                available_features = [col for col in feature_columns if col in players_df.columns]
-                X = players_df[available_features]
-                
-                # Fill any missing values
-                X = X.fillna(0)
+                available_features = [col for col in self.FEATURE_COLUMNS if col in players_df.columns]
                 
-                predictions = self.model.predict(X)
-                players_df['predicted_points'] = predictions
+                # Single batched inference call; pass the DataFrame so the model sees the feature names
+                X = players_df[available_features].fillna(0)
+                players_df['predicted_points'] = self.model.predict(X)
                 
                 logger.info("📊 Used basic trained model for predictions")
                 
@@ -182,7 +185,7 @@ class FPLOptimizer:
             
             # 7. Top 5 Team Bonus (5% weight) - NEW: boost for big teams
             top5_teams = ['Man City', 'Arsenal', 'Liverpool', 'Chelsea', 'Man Utd']  # Adjust as needed
-            top5_bonus = players_df['team'].apply(lambda x: 1.0 if x in top5_teams else 0.0) * 2.0
+            top5_bonus = players_df['team'].isin(top5_teams).astype(float) * 2.0
             top5_bonus = np.clip(top5_bonus, 0, 2)
             
             # Weighted combination with updated strategic focus
@@ -247,43 +250,41 @@ class FPLOptimizer:
                 logger.warning("No FDR data available, using neutral fixture scores")
                 return np.full(len(players_df), 4.0)  # Neutral score
             
-            # Calculate position-specific fixture advantages
-            for idx, player in players_df.iterrows():
-                position = player['position']
-                base_score = 0
-                
-                # Get FDR values (default to 3.0 if missing)
-                fdr_overall = player.get('fdr_overall', 3.0)
-                fdr_attack = player.get('fdr_attack', 3.0) 
-                fdr_defence = player.get('fdr_defence', 3.0)
-                
-                # Position-specific fixture scoring
-                if position in ['Forward', 'Midfielder']:
+            # Position-specific fixture advantages, computed column-wise
+            position = players_df['position'].to_numpy()
+            fdr_overall, fdr_attack, fdr_defence = self._fdr_arrays(players_df)
+            
+            # np.fmax treats missing FDR as no advantage, like max(0, nan)
+            attack_advantage = np.fmax(0, 5 - fdr_attack)  # 0-4 scale
+            defence_advantage = np.fmax(0, 5 - fdr_defence)
+            overall_advantage = np.fmax(0, 5 - fdr_overall)
+            
+            base_score = np.select(
+                [
                     # Attackers benefit from low attack FDR (easier to score/assist)
-                    attack_advantage = max(0, 5 - fdr_attack)  # 0-4 scale
-                    overall_advantage = max(0, 5 - fdr_overall) * 0.5  # 0-2 scale
-                    base_score = attack_advantage + overall_advantage
-                    
-                elif position == 'Defender':
+                    np.isin(position, ['Forward', 'Midfielder']),
                     # Defenders benefit from low defence FDR (clean sheets + attacking returns)
-                    defence_advantage = max(0, 5 - fdr_defence) * 1.2  # Weighted higher
-                    attack_advantage = max(0, 5 - fdr_attack) * 0.4   # Some attacking potential
-                    overall_advantage = max(0, 5 - fdr_overall) * 0.4
-                    base_score = defence_advantage + attack_advantage + overall_advantage
-                    
-                elif position == 'Goalkeeper':
+                    position == 'Defender',
                     # Goalkeepers primarily benefit from low defence FDR
-                    defence_advantage = max(0, 5 - fdr_defence) * 1.5  # Heavily weighted
-                    overall_advantage = max(0, 5 - fdr_overall) * 0.3
-                    base_score = defence_advantage + overall_advantage
-                
-                # Apply team strength modifiers
-                # Popular teams (high selection %) often have better fixtures or easier wins
-                team_popularity = player.get('selected_by_percent', 0) / 100
-                popularity_bonus = team_popularity * 0.5  # Small bonus for popular teams
-                
-                # Combine for final fixture score
-                fixture_scores[idx] = base_score + popularity_bonus
+                    position == 'Goalkeeper'
+                ],
+                [
+                    attack_advantage + overall_advantage * 0.5,
+                    defence_advantage * 1.2 + attack_advantage * 0.4 + overall_advantage * 0.4,
+                    defence_advantage * 1.5 + overall_advantage * 0.3
+                ],
+                default=0.0
+            )
+            
+            # Apply team strength modifiers
+            # Popular teams (high selection %) often have better fixtures or easier wins
+            if 'selected_by_percent' in players_df.columns:
+                popularity_bonus = players_df['selected_by_percent'].to_numpy(dtype=float) / 100 * 0.5
+            else:
+                popularity_bonus = 0.0
+            
+            # Combine for final fixture score
+            fixture_scores = base_score + popularity_bonus
                 
             logger.info(f"Calculated fixture advantages: avg={fixture_scores.mean():.2f}, max={fixture_scores.max():.2f}")
             
@@ -297,34 +298,30 @@ class FPLOptimizer:
         """Apply FDR adjustments to predicted points"""
         logger.info("Applying FDR adjustments to predictions...")
         
-        # Apply position-specific FDR adjustments
-        for idx, player in players_df.iterrows():
-            position = player['position']
-            base_points = player['predicted_points']
-            
-            # Get FDR values
-            fdr_attack = player.get('fdr_attack', 3.0)
-            fdr_defence = player.get('fdr_defence', 3.0)
-            fdr_overall = player.get('fdr_overall', 3.0)
-            
-            # Position-specific FDR impact
-            if position in ['Forward', 'Midfielder']:
+        # Apply position-specific FDR adjustments in one vectorized pass
+        position = players_df['position'].to_numpy()
+        fdr_overall, fdr_attack, fdr_defence = self._fdr_arrays(players_df)
+        overall_term = self.fdr_weights['overall'] * (5 - fdr_overall)
+        
+        fdr_multiplier = np.select(
+            [
                 # Attackers benefit more from low attack FDR
-                fdr_multiplier = 1 + (self.fdr_weights['attack'] * (5 - fdr_attack))
-                fdr_multiplier += self.fdr_weights['overall'] * (5 - fdr_overall)
-            elif position == 'Defender':
+                np.isin(position, ['Forward', 'Midfielder']),
                 # Defenders benefit from low defence FDR (clean sheets)
-                fdr_multiplier = 1 + (self.fdr_weights['defence'] * (5 - fdr_defence))
-                fdr_multiplier += self.fdr_weights['overall'] * (5 - fdr_overall)
-            elif position == 'Goalkeeper':
+                position == 'Defender',
                 # Goalkeepers benefit most from low defence FDR
-                fdr_multiplier = 1 + (self.fdr_weights['defence'] * 1.5 * (5 - fdr_defence))
-                fdr_multiplier += self.fdr_weights['overall'] * (5 - fdr_overall)
-            else:
-                fdr_multiplier = 1.0
-            
-            # Apply the adjustment
-            players_df.loc[idx, 'predicted_points'] = base_points * fdr_multiplier
+                position == 'Goalkeeper'
+            ],
+            [
+                1 + self.fdr_weights['attack'] * (5 - fdr_attack) + overall_term,
+                1 + self.fdr_weights['defence'] * (5 - fdr_defence) + overall_term,
+                1 + self.fdr_weights['defence'] * 1.5 * (5 - fdr_defence) + overall_term
+            ],
+            default=1.0
+        )
+        
+        # Apply the adjustment
+        players_df['predicted_points'] = players_df['predicted_points'] * fdr_multiplier
         
         # Add FDR-adjusted derived metrics
         players_df['fdr_adjusted_value'] = players_df['predicted_points'] / players_df['cost']
@@ -332,6 +329,14 @@ class FPLOptimizer:
         logger.info("FDR adjustments applied successfully")
         return players_df
     
+    def _fdr_arrays(self, players_df):
+        """Return (overall, attack, defence) FDR arrays, defaulting missing columns to 3.0"""
+        return tuple(
+            players_df[col].to_numpy(dtype=float) if col in players_df.columns
+            else np.full(len(players_df), 3.0)
+            for col in ['fdr_overall', 'fdr_attack', 'fdr_defence']
+        )
+    
     def set_fdr_weights(self, weights):
         """Set FDR impact weights"""
         self.fdr_weights.update(weights)
@@ -358,114 +363,119 @@ class FPLOptimizer:
         # Create the optimization problem
         prob = LpProblem("FPL_Squad_Selection", LpMaximize)
         
-        # Decision variables: binary variable for each player
-        player_vars = {}
-        for idx, player in players_df.iterrows():
-            player_vars[idx] = LpVariable(f"player_{idx}", cat='Binary')
+        # Pull model inputs out as plain arrays once instead of a .loc lookup per player
+        player_indices = players_df.index.tolist()
+        final_points = players_df['final_points'].to_numpy()
+        costs = players_df['cost'].to_numpy()
+        
+        # Budget arithmetic in integer tenths of £1m (FPL's native price unit) so the
+        # solver never compares float sums like 99.99999 against 100.0
+        costs_int = np.rint(costs * 10).astype(np.int64)
+        budget_int = int(round(self.budget * 10))
+        min_budget_int = int(np.ceil(round(self.budget * self.min_budget_usage * 10, 6)))
         
-        # Additional variables for starting XI selection
-        starting_vars = {}
-        for idx, player in players_df.iterrows():
-            starting_vars[idx] = LpVariable(f"starting_{idx}", cat='Binary')
+        # Group row labels by position / team once rather than re-scanning the frame per constraint
+        position_groups = players_df.groupby('position').groups
+        team_groups = players_df.groupby('team').groups
+        team_position_groups = players_df.groupby(['team', 'position']).groups
+        
+        # Decision variables: binary variable for each player (squad and starting XI)
+        player_vars = LpVariable.dicts("player", player_indices, cat='Binary')
+        starting_vars = LpVariable.dicts("starting", player_indices, cat='Binary')
         
         # Objective function: maximize weighted predicted points with strong starting XI bias
         # Heavy penalty for expensive players on bench to force them into starting XI
-        prob += lpSum([
-            players_df.loc[idx, 'final_points'] * player_vars[idx] +
-            players_df.loc[idx, 'final_points'] * 2.0 * starting_vars[idx] +  # Strong starting XI bonus
-            players_df.loc[idx, 'cost'] * 10.0 * starting_vars[idx]  # Cost bonus for starting XI
-            for idx in players_df.index
-        ])
+        prob += lpSum(
+            points * player_vars[idx] +
+            (points * 2.0 +  # Strong starting XI bonus
+             cost * 10.0) * starting_vars[idx]  # Cost bonus for starting XI
+            for idx, points, cost in zip(player_indices, final_points, costs)
+        )
         
         # Constraint 1: Budget constraint with minimum usage
-        total_cost = lpSum([players_df.loc[idx, 'cost'] * player_vars[idx] for idx in players_df.index])
-        prob += total_cost <= self.budget
-        prob += total_cost >= self.budget * self.min_budget_usage  # Use at least 99% of budget
+        total_cost = lpSum(int(cost) * player_vars[idx] for idx, cost in zip(player_indices, costs_int))
+        prob += total_cost <= budget_int
+        prob += total_cost >= min_budget_int  # Use at least 99% of budget
         
         # Constraint 2: Total squad size (15 players)
-        prob += lpSum([player_vars[idx] for idx in players_df.index]) == 15
+        prob += lpSum(player_vars.values()) == 15
         
         # Constraint 3: Starting XI size (11 players)
-        prob += lpSum([starting_vars[idx] for idx in players_df.index]) == 11
+        prob += lpSum(starting_vars.values()) == 11
         
         # Constraint 4: Starting players must be in squad
-        for idx in players_df.index:
+        for idx in player_indices:
             prob += starting_vars[idx] <= player_vars[idx]
         
         # Constraint 5: Position requirements for full squad
         for position, required_count in self.position_requirements.items():
-            position_players = players_df[players_df['position'] == position].index
-            prob += lpSum([player_vars[idx] for idx in position_players]) == required_count
+            position_players = position_groups.get(position, [])
+            prob += lpSum(player_vars[idx] for idx in position_players) == required_count
         
         # Constraint 6: Starting XI position requirements
-        gk_players = players_df[players_df['position'] == 'Goalkeeper'].index
-        def_players = players_df[players_df['position'] == 'Defender'].index
-        mid_players = players_df[players_df['position'] == 'Midfielder'].index
-        fwd_players = players_df[players_df['position'] == 'Forward'].index
-        
-        prob += lpSum([starting_vars[idx] for idx in gk_players]) == 1
-        prob += lpSum([starting_vars[idx] for idx in def_players]) >= 3
-        prob += lpSum([starting_vars[idx] for idx in def_players]) <= 5
-        prob += lpSum([starting_vars[idx] for idx in mid_players]) >= 2
-        prob += lpSum([starting_vars[idx] for idx in mid_players]) <= 5
-        prob += lpSum([starting_vars[idx] for idx in fwd_players]) >= 1
-        prob += lpSum([starting_vars[idx] for idx in fwd_players]) <= 3
+        gk_players = position_groups.get('Goalkeeper', [])
+        def_players = position_groups.get('Defender', [])
+        mid_players = position_groups.get('Midfielder', [])
+        fwd_players = position_groups.get('Forward', [])
+        
+        prob += lpSum(starting_vars[idx] for idx in gk_players) == 1
+        prob += lpSum(starting_vars[idx] for idx in def_players) >= 3
+        prob += lpSum(starting_vars[idx] for idx in def_players) <= 5
+        prob += lpSum(starting_vars[idx] for idx in mid_players) >= 2
+        prob += lpSum(starting_vars[idx] for idx in mid_players) <= 5
+        prob += lpSum(starting_vars[idx] for idx in fwd_players) >= 1
+        prob += lpSum(starting_vars[idx] for idx in fwd_players) <= 3
         
         # Constraint 7: Team requirements and team-position limits
-        for team in players_df['team'].unique():
-            team_players = players_df[players_df['team'] == team].index
-            
+        for team, team_players in team_groups.items():
             # Custom team requirements
             if team in self.team_requirements:
-                prob += lpSum([player_vars[idx] for idx in team_players]) == self.team_requirements[team]
+                prob += lpSum(player_vars[idx] for idx in team_players) == self.team_requirements[team]
             else:
                 # Default maximum players per team
-                prob += lpSum([player_vars[idx] for idx in team_players]) <= self.max_players_per_team
+                prob += lpSum(player_vars[idx] for idx in team_players) <= self.max_players_per_team
             
             # Team-specific position limits (prevent too many of same position from one team)
             if team in self.team_position_limits:
                 for position, max_count in self.team_position_limits[team].items():
-                    team_position_players = players_df[
-                        (players_df['team'] == team) & (players_df['position'] == position)
-                    ].index
+                    team_position_players = team_position_groups.get((team, position), [])
                     if len(team_position_players) > 0:
-                        prob += lpSum([player_vars[idx] for idx in team_position_players]) <= max_count
+                        prob += lpSum(player_vars[idx] for idx in team_position_players) <= max_count
             else:
                 # Default: prevent more than 2 players of same position from same team
                 for position in ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']:
-                    team_position_players = players_df[
-                        (players_df['team'] == team) & (players_df['position'] == position)
-                    ].index
+                    team_position_players = team_position_groups.get((team, position), [])
                     if len(team_position_players) > 0:
                         max_same_position = 2 if position in ['Defender', 'Midfielder'] else 1
-                        prob += lpSum([player_vars[idx] for idx in team_position_players]) <= max_same_position
+                        prob += lpSum(player_vars[idx] for idx in team_position_players) <= max_same_position
         
         # Constraint 8: Expensive players must start (prevent high-value bench warmers)
-        expensive_players = players_df[players_df['cost'] >= self.expensive_threshold].index
+        expensive_players = players_df.index[costs >= self.expensive_threshold]
         for idx in expensive_players:
             # If an expensive player is selected, they should have high probability of starting
             prob += starting_vars[idx] >= 0.8 * player_vars[idx]  # 80% chance to start if selected
         
         # Constraint 9: Limit very expensive players on bench
-        very_expensive_players = players_df[players_df['cost'] >= self.very_expensive_threshold].index
-        bench_expensive = lpSum([player_vars[idx] - starting_vars[idx] for idx in very_expensive_players])
+        very_expensive_players = players_df.index[costs >= self.very_expensive_threshold]
+        bench_expensive = lpSum(player_vars[idx] - starting_vars[idx] for idx in very_expensive_players)
         prob += bench_expensive <= self.max_expensive_bench
         
         # Constraint 10: Force include manually selected players
         if hasattr(self, 'manually_selected_players') and self.manually_selected_players:
             for player_index in self.manually_selected_players:
-                if player_index in players_df.index:
+                if player_index in player_vars:
                     prob += player_vars[player_index] == 1  # Force selection
         
         # Solve the problem
-        prob.solve(PULP_CBC_CMD(msg=0))  # Silent solver
+        # CBC is bundled with PuLP, so no extra solver dependency
+        prob.solve(PULP_CBC_CMD(**self.solver_options))
         
         # Extract results
         if prob.status == 1:  # Optimal solution found
             selected_indices = []
             starting_indices = []
             
-            for idx in players_df.index:
+            for idx in player_indices:
                 if player_vars[idx].varValue == 1:
                     selected_indices.append(idx)
                 if starting_vars[idx].varValue == 1:
@@ -503,7 +513,14 @@ class FPLOptimizer:
                 'budget_usage_pct': (total_cost / self.budget) * 100,
                 'position_breakdown': position_breakdown,
                 'starting_position_breakdown': starting_position_breakdown,
-                'team_breakdown': team_breakdown
+                'team_breakdown': team_breakdown,
+                # Display aggregates materialized once at optimize time
+                'squad_size': len(selected_players),
+                'position_counts': {
+                    position: position_breakdown.get(position, 0)
+                    for position in self.position_requirements
+                },
+                'max_per_team_actual': max(team_breakdown.values()) if team_breakdown else 0
             }
             
             logger.info(f"Optimization successful! Total predicted points: {total_predicted_points:.1f}")
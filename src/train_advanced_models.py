@@ -13,11 +13,8 @@ Run this script to build better prediction models.
 
 import pandas as pd
 import numpy as np
-import requests
-import json
 import os
 import logging
-from datetime import datetime, timedelta
 import sys
 
 # Add src directory to path
@@ -7,14 +7,9 @@ and live season statistics for FPL players.
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 import requests
-import json
-import sys
-import os
-import time
+
+from utils import navigate_to
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def fetch_current_season_data():
@@ -107,20 +102,11 @@ def create_current_season_page(players_df):
     # Navigation buttons to other pages
     col1, col2, col3, col4, col5 = st.columns(5)
     with col2:
-        if st.button("🚀 Squad Optimizer", key="goto_optimizer_from_season"):
-            st.session_state.current_page = 'optimizer'
-            st.session_state.last_user_interaction = time.time()
-            st.rerun()
+        st.button("🚀 Squad Optimizer", key="goto_optimizer_from_season", on_click=navigate_to, args=('optimizer',))
     with col3:
-        if st.button("📈 Player Stats", key="goto_stats_from_season"):
-            st.session_state.current_page = 'stats'
-            st.session_state.last_user_interaction = time.time()
-            st.rerun()
+        st.button("📈 Player Stats", key="goto_stats_from_season", on_click=navigate_to, args=('stats',))
     with col4:
-        if st.button("🗓️ Next 3 Gameweeks", key="goto_fixtures_from_season"):
-            st.session_state.current_page = 'fixtures'
-            st.session_state.last_user_interaction = time.time()
-            st.rerun()
+        st.button("🗓️ Next 3 Gameweeks", key="goto_fixtures_from_season", on_click=navigate_to, args=('fixtures',))
     
     st.divider()
     
@@ -317,6 +303,7 @@ def display_previous_gameweek(season_df, current_gw):
         form_ranges = pd.cut(season_df['form'], bins=[0, 2, 4, 6, 8, 10], labels=['0-2', '2-4', '4-6', '6-8', '8+'])
         form_counts = form_ranges.value_counts()
         
+        import plotly.express as px
         fig = px.bar(x=form_counts.index, y=form_counts.values, 
                     title="Number of Players by Form Range",
                     labels={'x': 'Form Range', 'y': 'Number of Players'},
@@ -416,6 +403,7 @@ def display_form_analysis(season_df):
     st.markdown("**🔥 Form vs Total Points Correlation:**")
     
     # Create scatter plot
+    import plotly.express as px
     fig = px.scatter(season_df, x='form', y='total_points', 
                     color='position', size='cost',
                     hover_name='web_name',
@@ -587,6 +575,7 @@ def display_value_players(season_df):
     # Ownership vs Points chart
     st.markdown("**📊 Ownership vs Points Analysis:**")
     
+    import plotly.express as px
     fig = px.scatter(season_df, x='selected_by_percent', y='total_points',
                     color='position', size='cost',
                     hover_name='web_name',
@@ -7,9 +7,8 @@ Handles data retrieval and analysis for individual player statistics.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import sys
-import os
-import time
+
+from utils import navigate_to, _player_data_mtime
 
 def _style_dataframe(df):
     """Apply consistent styling to dataframes for better alignment"""
@@ -51,10 +50,7 @@ def create_stats_page(players_df):
     # Navigation buttons in the main area
     col1, col2, col3, col4, col5 = st.columns(5)
     with col3:
-        if st.button("🔙 Back to Optimizer", key="back_to_optimizer"):
-            st.session_state.current_page = 'optimizer'
-            st.session_state.last_user_interaction = time.time()
-            st.rerun()
+        st.button("🔙 Back to Optimizer", key="back_to_optimizer", on_click=navigate_to, args=('optimizer',))
     
     st.divider()
     
@@ -96,8 +92,8 @@ def _display_top_performers(players_df):
         st.markdown("### 🏆 Top 10 Points Scorers")
         top_points = players_df.nlargest(10, 'total_points')[
             ['name', 'position', 'team', 'total_points', 'cost']
-        ].reset_index(drop=True)
-        top_points.index = top_points.index + 1
+        ]
+        top_points.index = pd.RangeIndex(1, len(top_points) + 1)
         st.dataframe(
             _style_dataframe(top_points), 
             use_container_width=True, 
@@ -115,8 +111,8 @@ def _display_top_performers(players_df):
         st.markdown("### 📈 Top 10 Form Players")
         top_form = players_df[players_df['form'] > 0].nlargest(10, 'form')[
             ['name', 'position', 'team', 'form', 'total_points', 'cost']
-        ].reset_index(drop=True)
-        top_form.index = top_form.index + 1
+        ]
+        top_form.index = pd.RangeIndex(1, len(top_form) + 1)
         st.dataframe(
             _style_dataframe(top_form), 
             use_container_width=True, 
@@ -139,8 +135,8 @@ def _display_top_performers(players_df):
         if 'ict_index' in players_df.columns:
             top_ict = players_df.nlargest(10, 'ict_index')[
                 ['name', 'position', 'team', 'ict_index', 'total_points']
-            ].reset_index(drop=True)
-            top_ict.index = top_ict.index + 1
+            ]
+            top_ict.index = pd.RangeIndex(1, len(top_ict) + 1)
             st.dataframe(
                 _style_dataframe(top_ict), 
                 use_container_width=True, 
@@ -160,8 +156,8 @@ def _display_top_performers(players_df):
         st.markdown("### ⏱️ Top 10 Minutes Played")
         top_minutes = players_df.nlargest(10, 'minutes')[
             ['name', 'position', 'team', 'minutes', 'total_points']
-        ].reset_index(drop=True)
-        top_minutes.index = top_minutes.index + 1
+        ]
+        top_minutes.index = pd.RangeIndex(1, len(top_minutes) + 1)
         st.dataframe(
             _style_dataframe(top_minutes), 
             use_container_width=True, 
@@ -186,8 +182,8 @@ def _display_attack_stats(players_df):
         if 'goals_scored' in players_df.columns:
             top_goals = players_df[players_df['goals_scored'] > 0].nlargest(10, 'goals_scored')[
                 ['name', 'position', 'team', 'goals_scored', 'total_points']
-            ].reset_index(drop=True)
-            top_goals.index = top_goals.index + 1
+            ]
+            top_goals.index = pd.RangeIndex(1, len(top_goals) + 1)
             st.dataframe(
                 _style_dataframe(top_goals), 
                 use_container_width=True, 
@@ -208,8 +204,8 @@ def _display_attack_stats(players_df):
         if 'assists' in players_df.columns:
             top_assists = players_df[players_df['assists'] > 0].nlargest(10, 'assists')[
                 ['name', 'position', 'team', 'assists', 'total_points']
-            ].reset_index(drop=True)
-            top_assists.index = top_assists.index + 1
+            ]
+            top_assists.index = pd.RangeIndex(1, len(top_assists) + 1)
             st.dataframe(
                 _style_dataframe(top_assists), 
                 use_container_width=True, 
@@ -235,8 +231,8 @@ def _display_attack_stats(players_df):
             players_with_involvement['goal_involvement'] = players_with_involvement['goals_scored'] + players_with_involvement['assists']
             top_involvement = players_with_involvement[players_with_involvement['goal_involvement'] > 0].nlargest(10, 'goal_involvement')[
                 ['name', 'position', 'team', 'goal_involvement', 'goals_scored', 'assists']
-            ].reset_index(drop=True)
-            top_involvement.index = top_involvement.index + 1
+            ]
+            top_involvement.index = pd.RangeIndex(1, len(top_involvement) + 1)
             st.dataframe(top_involvement, use_container_width=True, hide_index=False)
         else:
             st.info("Goal involvement data not available")
@@ -277,8 +273,8 @@ def _display_attack_stats(players_df):
         if 'penalties_missed' in players_df.columns:
             pen_missed = players_df[players_df['penalties_missed'] > 0].nlargest(10, 'penalties_missed')[
                 ['name', 'position', 'team', 'penalties_missed', 'total_points']
-            ].reset_index(drop=True)
-            pen_missed.index = pen_missed.index + 1
+            ]
+            pen_missed.index = pd.RangeIndex(1, len(pen_missed) + 1)
             st.dataframe(pen_missed, use_container_width=True, hide_index=False)
         else:
             st.info("Penalty miss data not available")
@@ -288,8 +284,8 @@ def _display_attack_stats(players_df):
         if 'points_per_game' in players_df.columns:
             top_ppg = players_df[players_df['points_per_game'] > 0].nlargest(10, 'points_per_game')[
                 ['name', 'position', 'team', 'points_per_game', 'total_points', 'minutes']
-            ].reset_index(drop=True)
-            top_ppg.index = top_ppg.index + 1
+            ]
+            top_ppg.index = pd.RangeIndex(1, len(top_ppg) + 1)
             st.dataframe(top_ppg, use_container_width=True, hide_index=False)
         else:
             st.info("Points per game data not available")
@@ -305,8 +301,8 @@ def _display_defense_stats(players_df):
         if 'clean_sheets' in players_df.columns:
             top_cs = players_df[players_df['clean_sheets'] > 0].nlargest(10, 'clean_sheets')[
                 ['name', 'position', 'team', 'clean_sheets', 'total_points']
-            ].reset_index(drop=True)
-            top_cs.index = top_cs.index + 1
+            ]
+            top_cs.index = pd.RangeIndex(1, len(top_cs) + 1)
             st.dataframe(
                 _style_dataframe(top_cs), 
                 use_container_width=True, 
@@ -330,8 +326,8 @@ def _display_defense_stats(players_df):
                 (players_df['saves'] > 0)
             ].nlargest(10, 'saves')[
                 ['name', 'team', 'saves', 'clean_sheets', 'total_points']
-            ].reset_index(drop=True)
-            gk_saves.index = gk_saves.index + 1
+            ]
+            gk_saves.index = pd.RangeIndex(1, len(gk_saves) + 1)
             st.dataframe(gk_saves, use_container_width=True, hide_index=False)
         else:
             st.info("Saves data not available")
@@ -344,8 +340,8 @@ def _display_defense_stats(players_df):
         if 'penalties_saved' in players_df.columns:
             pen_saves = players_df[players_df['penalties_saved'] > 0].nlargest(10, 'penalties_saved')[
                 ['name', 'position', 'team', 'penalties_saved', 'total_points']
-            ].reset_index(drop=True)
-            pen_saves.index = pen_saves.index + 1
+            ]
+            pen_saves.index = pd.RangeIndex(1, len(pen_saves) + 1)
             st.dataframe(pen_saves, use_container_width=True, hide_index=False)
         else:
             st.info("Penalty saves data not available")
@@ -355,8 +351,8 @@ def _display_defense_stats(players_df):
         if 'own_goals' in players_df.columns:
             own_goals = players_df[players_df['own_goals'] > 0].nlargest(10, 'own_goals')[
                 ['name', 'position', 'team', 'own_goals', 'total_points']
-            ].reset_index(drop=True)
-            own_goals.index = own_goals.index + 1
+            ]
+            own_goals.index = pd.RangeIndex(1, len(own_goals) + 1)
             st.dataframe(own_goals, use_container_width=True, hide_index=False)
         else:
             st.info("Own goals data not available")
@@ -369,8 +365,8 @@ def _display_defense_stats(players_df):
         if 'goals_conceded' in players_df.columns:
             goals_conceded = players_df[players_df['goals_conceded'] > 0].nlargest(10, 'goals_conceded')[
                 ['name', 'position', 'team', 'goals_conceded', 'minutes']
-            ].reset_index(drop=True)
-            goals_conceded.index = goals_conceded.index + 1
+            ]
+            goals_conceded.index = pd.RangeIndex(1, len(goals_conceded) + 1)
             st.dataframe(goals_conceded, use_container_width=True, hide_index=False)
         else:
             st.info("Goals conceded data not available")
@@ -386,8 +382,8 @@ def _display_general_stats(players_df):
         if 'yellow_cards' in players_df.columns:
             top_yellows = players_df[players_df['yellow_cards'] > 0].nlargest(10, 'yellow_cards')[
                 ['name', 'position', 'team', 'yellow_cards', 'total_points']
-            ].reset_index(drop=True)
-            top_yellows.index = top_yellows.index + 1
+            ]
+            top_yellows.index = pd.RangeIndex(1, len(top_yellows) + 1)
             st.dataframe(
                 _style_dataframe(top_yellows), 
                 use_container_width=True, 
@@ -408,8 +404,8 @@ def _display_general_stats(players_df):
         if 'red_cards' in players_df.columns:
             top_reds = players_df[players_df['red_cards'] > 0].nlargest(10, 'red_cards')[
                 ['name', 'position', 'team', 'red_cards', 'total_points']
-            ].reset_index(drop=True)
-            top_reds.index = top_reds.index + 1
+            ]
+            top_reds.index = pd.RangeIndex(1, len(top_reds) + 1)
             st.dataframe(
                 _style_dataframe(top_reds), 
                 use_container_width=True, 
@@ -433,8 +429,8 @@ def _display_general_stats(players_df):
         if 'bonus' in players_df.columns:
             top_bonus = players_df[players_df['bonus'] > 0].nlargest(10, 'bonus')[
                 ['name', 'position', 'team', 'bonus', 'total_points']
-            ].reset_index(drop=True)
-            top_bonus.index = top_bonus.index + 1
+            ]
+            top_bonus.index = pd.RangeIndex(1, len(top_bonus) + 1)
             st.dataframe(
                 _style_dataframe(top_bonus), 
                 use_container_width=True, 
@@ -455,8 +451,8 @@ def _display_general_stats(players_df):
         if 'selected_by_percent' in players_df.columns:
             top_owned = players_df.nlargest(10, 'selected_by_percent')[
                 ['name', 'position', 'team', 'selected_by_percent', 'total_points']
-            ].reset_index(drop=True)
-            top_owned.index = top_owned.index + 1
+            ]
+            top_owned.index = pd.RangeIndex(1, len(top_owned) + 1)
             st.dataframe(
                 _style_dataframe(top_owned), 
                 use_container_width=True, 
@@ -480,8 +476,8 @@ def _display_general_stats(players_df):
         if 'bps' in players_df.columns:
             top_bps = players_df[players_df['bps'] > 0].nlargest(10, 'bps')[
                 ['name', 'position', 'team', 'bps', 'bonus']
-            ].reset_index(drop=True)
-            top_bps.index = top_bps.index + 1
+            ]
+            top_bps.index = pd.RangeIndex(1, len(top_bps) + 1)
             st.dataframe(top_bps, use_container_width=True, hide_index=False)
         else:
             st.info("BPS data not available")
@@ -491,8 +487,8 @@ def _display_general_stats(players_df):
         if 'cost_efficiency' in players_df.columns:
             top_value = players_df[players_df['total_points'] > 50].nlargest(10, 'cost_efficiency')[
                 ['name', 'position', 'team', 'cost_efficiency', 'cost', 'total_points']
-            ].reset_index(drop=True)
-            top_value.index = top_value.index + 1
+            ]
+            top_value.index = pd.RangeIndex(1, len(top_value) + 1)
             st.dataframe(top_value, use_container_width=True, hide_index=False)
         else:
             st.info("Value efficiency data not available")
@@ -508,8 +504,8 @@ def _display_advanced_stats(players_df):
         if 'influence' in players_df.columns:
             top_influence = players_df[players_df['influence'] > 0].nlargest(10, 'influence')[
                 ['name', 'position', 'team', 'influence', 'total_points']
-            ].reset_index(drop=True)
-            top_influence.index = top_influence.index + 1
+            ]
+            top_influence.index = pd.RangeIndex(1, len(top_influence) + 1)
             st.dataframe(top_influence, use_container_width=True, hide_index=False)
         else:
             st.info("Influence data not available")
@@ -519,8 +515,8 @@ def _display_advanced_stats(players_df):
         if 'creativity' in players_df.columns:
             top_creativity = players_df[players_df['creativity'] > 0].nlargest(10, 'creativity')[
                 ['name', 'position', 'team', 'creativity', 'assists']
-            ].reset_index(drop=True)
-            top_creativity.index = top_creativity.index + 1
+            ]
+            top_creativity.index = pd.RangeIndex(1, len(top_creativity) + 1)
             st.dataframe(top_creativity, use_container_width=True, hide_index=False)
         else:
             st.info("Creativity data not available")
@@ -533,8 +529,8 @@ def _display_advanced_stats(players_df):
         if 'threat' in players_df.columns:
             top_threat = players_df[players_df['threat'] > 0].nlargest(10, 'threat')[
                 ['name', 'position', 'team', 'threat', 'goals_scored']
-            ].reset_index(drop=True)
-            top_threat.index = top_threat.index + 1
+            ]
+            top_threat.index = pd.RangeIndex(1, len(top_threat) + 1)
             st.dataframe(top_threat, use_container_width=True, hide_index=False)
         else:
             st.info("Threat data not available")
@@ -544,8 +540,8 @@ def _display_advanced_stats(players_df):
         if 'transfers_in' in players_df.columns:
             top_transfers_in = players_df[players_df['transfers_in'] > 0].nlargest(10, 'transfers_in')[
                 ['name', 'position', 'team', 'transfers_in', 'selected_by_percent']
-            ].reset_index(drop=True)
-            top_transfers_in.index = top_transfers_in.index + 1
+            ]
+            top_transfers_in.index = pd.RangeIndex(1, len(top_transfers_in) + 1)
             st.dataframe(top_transfers_in, use_container_width=True, hide_index=False)
         else:
             st.info("Transfer data not available")
@@ -558,8 +554,8 @@ def _display_advanced_stats(players_df):
         if 'value_form' in players_df.columns:
             top_value_form = players_df[players_df['value_form'] > 0].nlargest(10, 'value_form')[
                 ['name', 'position', 'team', 'value_form', 'form', 'cost']
-            ].reset_index(drop=True)
-            top_value_form.index = top_value_form.index + 1
+            ]
+            top_value_form.index = pd.RangeIndex(1, len(top_value_form) + 1)
             st.dataframe(top_value_form, use_container_width=True, hide_index=False)
         else:
             st.info("Value form data not available")
@@ -569,8 +565,8 @@ def _display_advanced_stats(players_df):
         if 'value_season' in players_df.columns:
             top_value_season = players_df[players_df['value_season'] > 0].nlargest(10, 'value_season')[
                 ['name', 'position', 'team', 'value_season', 'total_points', 'cost']
-            ].reset_index(drop=True)
-            top_value_season.index = top_value_season.index + 1
+            ]
+            top_value_season.index = pd.RangeIndex(1, len(top_value_season) + 1)
             st.dataframe(top_value_season, use_container_width=True, hide_index=False)
         else:
             st.info("Value season data not available")
@@ -593,12 +589,14 @@ def _display_advanced_stats(players_df):
     else:
         st.info("No suitable budget options found")
 
-def _display_team_analysis(players_df):
-    """Display team analysis"""
-    st.subheader("📈 Team Analysis")
+@st.cache_data(show_spinner=False, max_entries=1)  # One entry per data file version
+def _team_stats(data_mtime, _players_df):
+    """Per-team performance summary, computed once per version of the player data file.
     
-    # Team performance summary
-    team_stats = players_df.groupby('team').agg({
+    The page receives load_available_players(), a pure function of the file's mtime, so
+    the mtime is the key and the DataFrame itself is never hashed.
+    """
+    team_stats = _players_df.groupby('team').agg({
         'total_points': 'sum',
         'goals_scored': 'sum',
         'assists': 'sum',
@@ -608,7 +606,14 @@ def _display_team_analysis(players_df):
     }).round(2)
     
     team_stats.columns = ['Total Points', 'Goals', 'Assists', 'Avg Cost', 'Total Minutes', 'Player Count']
-    team_stats = team_stats.sort_values('Total Points', ascending=False)
+    return team_stats.sort_values('Total Points', ascending=False)
+
+def _display_team_analysis(players_df):
+    """Display team analysis"""
+    st.subheader("📈 Team Analysis")
+    
+    # Team performance summary
+    team_stats = _team_stats(_player_data_mtime(), players_df)
     
     st.markdown("### 🏆 Team Performance Summary")
     st.dataframe(
@@ -630,12 +635,12 @@ def _display_team_analysis(players_df):
     
     with col1:
         st.markdown("### 🥅 Most Goals by Team")
-        goals_by_team = players_df.groupby('team')['goals_scored'].sum().sort_values(ascending=False).head(10)
+        goals_by_team = team_stats['Goals'].rename('goals_scored').sort_values(ascending=False).head(10)
         st.bar_chart(goals_by_team)
     
     with col2:
         st.markdown("### 🎯 Most Assists by Team")
-        assists_by_team = players_df.groupby('team')['assists'].sum().sort_values(ascending=False).head(10)
+        assists_by_team = team_stats['Assists'].rename('assists').sort_values(ascending=False).head(10)
         st.bar_chart(assists_by_team)
 
 def get_top_performers(players_df, metric='total_points', top_n=10, position=None):
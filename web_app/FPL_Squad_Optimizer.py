@@ -42,10 +42,15 @@ Contains all logi      budget = st.sid        va            help="Total budget f
 """
 
 import streamlit as st
-import pandas as pd
+from pandas import DataFrame, Index
+from pandas.util import hash_pandas_object
+import numpy as np
 import sys
 import os
 import time
+import threading
+
+from utils import navigate_to
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -55,13 +60,65 @@ try:
 except ImportError:
     st.error("Could not import FPLOptimizer module.")
 
-@st.cache_resource
-def load_optimizer(budget):
-    """Load and cache the optimizer"""
-    return FPLOptimizer(budget=budget)
+# Display columns for the squad tables (starting XI and bench omit season points)
+_SQUAD_COLS = ['name', 'position', 'team', 'cost', 'predicted_points', 'form', 'total_points']
+_LINEUP_COLS = ['name', 'position', 'team', 'cost', 'predicted_points', 'form']
+
+# Shared column configuration: starting XI and bench use the base set,
+# the full squad adds season points on top
+_BASE_COLCFG = {
+    "name": st.column_config.TextColumn("Player"),
+    "position": st.column_config.TextColumn("Position"),
+    "team": st.column_config.TextColumn("Team"),
+    "cost": st.column_config.NumberColumn("Cost (£m)", format="%.1f"),
+    "predicted_points": st.column_config.NumberColumn("Predicted Points", format="%.1f"),
+    "form": st.column_config.NumberColumn("Form", format="%.1f"),
+}
+_SQUAD_COLCFG = {**_BASE_COLCFG, "total_points": st.column_config.NumberColumn("Season Points", format="%d")}
+
+# Settings rows that do not depend on user input
+_STATIC_SETTINGS_ROWS = (('Max per Team', '3 players'),)
+
+@st.cache_resource(show_spinner=False)  # Also called from the warm-up thread, which has no script context
+def load_prediction_models():
+    """Load the trained prediction models once and share them across optimizers"""
+    loader = FPLOptimizer()
+    loader.load_model()
+    return loader.model, loader.ensemble_predictor, loader.advanced_models_loaded
+
+# Background model warm-up (one per process; this module stays imported across reruns)
+_model_warmup_thread = None
+
+def warm_prediction_models():
+    """Start loading the prediction models in a background thread so the first optimize click finds them cached"""
+    global _model_warmup_thread
+    if _model_warmup_thread is None:
+        _model_warmup_thread = threading.Thread(target=load_prediction_models, daemon=True)
+        _model_warmup_thread.start()
+
+def _new_optimizer(**kwargs):
+    """Build a fresh optimizer with the shared cached prediction models attached"""
+    optimizer = FPLOptimizer(**kwargs)
+    optimizer.model, optimizer.ensemble_predictor, optimizer.advanced_models_loaded = load_prediction_models()
+    return optimizer
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_predictions(players_hash, use_fdr, fdr_weights, _players_df):
+    """Predicted points for a candidate pool, keyed on its content hash and the FDR settings.
+    
+    Predicts with a fresh optimizer configured from the key arguments, so the cached
+    result always matches its key. Predictions do not depend on the budget or any
+    other MILP setting.
+    """
+    optimizer = _new_optimizer()
+    optimizer.use_fdr = use_fdr
+    if use_fdr:
+        optimizer.set_fdr_weights(dict(fdr_weights))
+    return optimizer.predict_points(_players_df)
 
 def create_optimizer_page(players_df):
     """Create the main optimizer page"""
+    ss = st.session_state
     
     # Header
     st.markdown('<h1 class="main-header">⚽ FPL Squad Optimizer</h1>', unsafe_allow_html=True)
@@ -76,10 +133,7 @@ def create_optimizer_page(players_df):
     # Navigation button to Stats page
     col1, col2, col3, col4, col5 = st.columns(5)
     with col3:
-        if st.button("📊 View Player Stats", key="goto_stats"):
-            st.session_state.current_page = 'stats'
-            st.session_state.last_user_interaction = time.time()
-            st.rerun()
+        st.button("📊 View Player Stats", key="goto_stats", on_click=navigate_to, args=('stats',))
     
     st.divider()
     
@@ -101,12 +155,26 @@ def create_optimizer_page(players_df):
     st.sidebar.subheader("Advanced Settings")
     
     # Initialize session state for manually selected players
-    if 'manually_selected_players' not in st.session_state:
-        st.session_state.manually_selected_players = []
+    if 'manually_selected_players' not in ss:
+        ss.manually_selected_players = []
     
     # Initialize session state for excluded players
-    if 'manually_excluded_players' not in st.session_state:
-        st.session_state.manually_excluded_players = []
+    if 'manually_excluded_players' not in ss:
+        ss.manually_excluded_players = []
+    
+    # Local handles to the selection lists (reassignments below still go through ss)
+    msp = ss.manually_selected_players
+    mep = ss.manually_excluded_players
+    
+    # Excluded row labels as a prebuilt Index, rebuilt only when the exclusion list changes
+    if 'excluded_index' not in ss:
+        ss.excluded_index = Index([p['index'] for p in mep])
+    
+    # Snapshot selection sizes and indices once per rerun (every change triggers st.rerun)
+    n_sel = len(msp)
+    n_exc = len(mep)
+    sel_idx_set = frozenset(p['index'] for p in msp)
+    exc_idx_set = frozenset(p['index'] for p in mep)
     
     # Manual Player Selection Filter
     manual_selection = st.sidebar.expander("👤 Manual Player Selection")
@@ -117,7 +185,7 @@ def create_optimizer_page(players_df):
         all_teams = sorted(players_df['team'].unique().tolist())
         
         def on_team_change():
-            st.session_state.last_user_interaction = time.time()
+            ss.last_user_interaction = time.time()
         
         selected_team = st.selectbox(
             "1️⃣ Select Team",
@@ -132,7 +200,7 @@ def create_optimizer_page(players_df):
             available_positions = sorted(team_players['position'].unique().tolist())
             
             def on_position_change():
-                st.session_state.last_user_interaction = time.time()
+                ss.last_user_interaction = time.time()
             
             selected_position = st.selectbox(
                 "2️⃣ Select Position",
@@ -150,7 +218,7 @@ def create_optimizer_page(players_df):
                 
                 for idx, player in position_players.iterrows():
                     # Check if player is already selected
-                    is_selected = any(p['index'] == idx for p in st.session_state.manually_selected_players)
+                    is_selected = idx in sel_idx_set
                     
                     col1, col2 = st.columns([3, 1])
                     with col1:
@@ -163,9 +231,9 @@ def create_optimizer_page(players_df):
                         if not is_selected:
                             if st.button("➕", key=f"add_{idx}", help="Add player"):
                                 # Track user interaction to prevent auto-refresh conflicts
-                                st.session_state.last_user_interaction = time.time()
+                                ss.last_user_interaction = time.time()
                                 # Add player to manual selection
-                                st.session_state.manually_selected_players.append({
+                                msp.append({
                                     'index': idx,  # Use dataframe index
                                     'id': player['id'],
                                     'name': player['name'],
@@ -176,14 +244,14 @@ def create_optimizer_page(players_df):
                                 st.rerun()
         
         # Show currently selected manual players
-        if st.session_state.manually_selected_players:
+        if msp:
             st.write("**🎯 Currently Selected Players:**")
             
             # Calculate totals
-            total_cost = sum(p['cost'] for p in st.session_state.manually_selected_players)
+            total_cost = sum(p['cost'] for p in msp)
             position_count = {'Goalkeeper': 0, 'Defender': 0, 'Midfielder': 0, 'Forward': 0}
             
-            for player in st.session_state.manually_selected_players:
+            for player in msp:
                 position_count[player['position']] += 1
                 
                 col1, col2 = st.columns([3, 1])
@@ -192,9 +260,9 @@ def create_optimizer_page(players_df):
                 with col2:
                     if st.button("❌", key=f"remove_{player['index']}", help="Remove player"):
                         # Track user interaction to prevent auto-refresh conflicts
-                        st.session_state.last_user_interaction = time.time()
-                        st.session_state.manually_selected_players = [
-                            p for p in st.session_state.manually_selected_players 
+                        ss.last_user_interaction = time.time()
+                        ss.manually_selected_players = [
+                            p for p in msp 
                             if p['index'] != player['index']
                         ]
                         st.rerun()
@@ -204,8 +272,8 @@ def create_optimizer_page(players_df):
             
             if st.button("🗑️ Clear All Selected Players", type="secondary"):
                 # Track user interaction to prevent auto-refresh conflicts
-                st.session_state.last_user_interaction = time.time()
-                st.session_state.manually_selected_players = []
+                ss.last_user_interaction = time.time()
+                ss.manually_selected_players = []
                 st.rerun()
     
     # Player Exclusion Filter
@@ -215,7 +283,7 @@ def create_optimizer_page(players_df):
         
         # Step 1: Select Team for exclusion
         def on_exclude_team_change():
-            st.session_state.last_user_interaction = time.time()
+            ss.last_user_interaction = time.time()
         
         excluded_team = st.selectbox(
             "1️⃣ Select Team",
@@ -230,7 +298,7 @@ def create_optimizer_page(players_df):
             exclude_available_positions = sorted(exclude_team_players['position'].unique().tolist())
             
             def on_exclude_position_change():
-                st.session_state.last_user_interaction = time.time()
+                ss.last_user_interaction = time.time()
             
             excluded_position = st.selectbox(
                 "2️⃣ Select Position",
@@ -248,7 +316,7 @@ def create_optimizer_page(players_df):
                 
                 for idx, player in exclude_position_players.iterrows():
                     # Check if player is already excluded
-                    is_excluded = any(p['index'] == idx for p in st.session_state.manually_excluded_players)
+                    is_excluded = idx in exc_idx_set
                     
                     col1, col2 = st.columns([3, 1])
                     with col1:
@@ -261,26 +329,27 @@ def create_optimizer_page(players_df):
                         if not is_excluded:
                             if st.button("🚫", key=f"exclude_{idx}", help="Exclude player"):
                                 # Track user interaction to prevent auto-refresh conflicts
-                                st.session_state.last_user_interaction = time.time()
+                                ss.last_user_interaction = time.time()
                                 # Add player to exclusion list
-                                st.session_state.manually_excluded_players.append({
+                                mep.append({
                                     'index': idx,
                                     'name': player['name'],
                                     'position': player['position'],
                                     'team': player['team'],
                                     'cost': player['cost']
                                 })
+                                ss.excluded_index = Index([p['index'] for p in mep])
                                 st.rerun()
         
         # Show currently excluded players
-        if st.session_state.manually_excluded_players:
+        if mep:
             st.write("**🚫 Currently Excluded Players:**")
             
             # Calculate totals
-            total_excluded = len(st.session_state.manually_excluded_players)
+            total_excluded = n_exc
             exclude_position_count = {'Goalkeeper': 0, 'Defender': 0, 'Midfielder': 0, 'Forward': 0}
             
-            for player in st.session_state.manually_excluded_players:
+            for player in mep:
                 exclude_position_count[player['position']] += 1
                 
                 col1, col2 = st.columns([3, 1])
@@ -289,11 +358,12 @@ def create_optimizer_page(players_df):
                 with col2:
                     if st.button("✅", key=f"include_{player['index']}", help="Remove from exclusion"):
                         # Track user interaction to prevent auto-refresh conflicts
-                        st.session_state.last_user_interaction = time.time()
-                        st.session_state.manually_excluded_players = [
-                            p for p in st.session_state.manually_excluded_players 
+                        ss.last_user_interaction = time.time()
+                        ss.manually_excluded_players = [
+                            p for p in mep 
                             if p['index'] != player['index']
                         ]
+                        ss.excluded_index = Index([p['index'] for p in ss.manually_excluded_players])
                         st.rerun()
             
             st.write(f"**Total Excluded:** {total_excluded} players")
@@ -301,15 +371,16 @@ def create_optimizer_page(players_df):
             
             if st.button("🗑️ Clear All Excluded Players", type="secondary", key="clear_excluded"):
                 # Track user interaction to prevent auto-refresh conflicts
-                st.session_state.last_user_interaction = time.time()
-                st.session_state.manually_excluded_players = []
+                ss.last_user_interaction = time.time()
+                ss.manually_excluded_players = []
+                ss.excluded_index = Index([])
                 st.rerun()
     
     # Team filter
     all_teams = ['All Teams'] + sorted(players_df['team'].unique().tolist())
     
     def on_excluded_teams_change():
-        st.session_state.last_user_interaction = time.time()
+        ss.last_user_interaction = time.time()
     
     excluded_teams = st.sidebar.multiselect(
         "Exclude Teams",
@@ -322,7 +393,7 @@ def create_optimizer_page(players_df):
     fdr_settings = st.sidebar.expander("🌟 FDR (Fixture Difficulty) Settings")
     with fdr_settings:
         def on_fdr_change():
-            st.session_state.last_user_interaction = time.time()
+            ss.last_user_interaction = time.time()
         
         use_fdr = st.checkbox(
             "Use FDR in optimization", 
@@ -344,27 +415,27 @@ def create_optimizer_page(players_df):
     with team_position_limits:
                 
         def on_limit_teams_change():
-            st.session_state.last_user_interaction = time.time()
+            ss.last_user_interaction = time.time()
         
         def on_position_limit_change():
             """Handle position limit changes"""
-            st.session_state.last_user_interaction = time.time()
+            ss.last_user_interaction = time.time()
         
         # Initialize session state for team limits if not exists
-        if 'selected_limit_teams' not in st.session_state:
-            st.session_state.selected_limit_teams = []
+        if 'selected_limit_teams' not in ss:
+            ss.selected_limit_teams = []
         
         # Update session state when teams change
         selected_limit_teams = st.multiselect(
             "Select teams to limit", 
             all_teams[1:],
-            default=st.session_state.selected_limit_teams,
+            default=ss.selected_limit_teams,
             key="team_limit_selector",
             on_change=on_limit_teams_change
         )
         
         # Update session state
-        st.session_state.selected_limit_teams = selected_limit_teams
+        ss.selected_limit_teams = selected_limit_teams
         
         team_pos_limits = {}
         for team in selected_limit_teams:
@@ -376,14 +447,14 @@ def create_optimizer_page(players_df):
             fwd_key = f"fwd_limit_{team}"
             gk_key = f"gk_limit_{team}"
             
-            if def_key not in st.session_state:
-                st.session_state[def_key] = 3  # More reasonable default
-            if mid_key not in st.session_state:
-                st.session_state[mid_key] = 3  # More reasonable default
-            if fwd_key not in st.session_state:
-                st.session_state[fwd_key] = 3  # More reasonable default
-            if gk_key not in st.session_state:
-                st.session_state[gk_key] = 2   # Keep at 2 for goalkeepers
+            if def_key not in ss:
+                ss[def_key] = 3  # More reasonable default
+            if mid_key not in ss:
+                ss[mid_key] = 3  # More reasonable default
+            if fwd_key not in ss:
+                ss[fwd_key] = 3  # More reasonable default
+            if gk_key not in ss:
+                ss[gk_key] = 2   # Keep at 2 for goalkeepers
             
             col1, col2 = st.columns(2)
             with col1:
@@ -391,7 +462,7 @@ def create_optimizer_page(players_df):
                     f"Max Defenders", 
                     min_value=0, 
                     max_value=5, 
-                    value=st.session_state[def_key],
+                    value=ss[def_key],
                     key=def_key,
                     help=f"Maximum defenders from {team}. Low values may cause optimization to fail.",
                     on_change=on_position_limit_change
@@ -400,7 +471,7 @@ def create_optimizer_page(players_df):
                     f"Max Forwards", 
                     min_value=0, 
                     max_value=3, 
-                    value=st.session_state[fwd_key],
+                    value=ss[fwd_key],
                     key=fwd_key,
                     help=f"Maximum forwards from {team}. Low values may cause optimization to fail.",
                     on_change=on_position_limit_change
@@ -410,7 +481,7 @@ def create_optimizer_page(players_df):
                     f"Max Midfielders", 
                     min_value=0, 
                     max_value=5, 
-                    value=st.session_state[mid_key],
+                    value=ss[mid_key],
                     key=mid_key,
                     help=f"Maximum midfielders from {team}. Low values may cause optimization to fail.",
                     on_change=on_position_limit_change
@@ -419,7 +490,7 @@ def create_optimizer_page(players_df):
                     f"Max Goalkeepers", 
                     min_value=0, 
                     max_value=2, 
-                    value=st.session_state[gk_key],
+                    value=ss[gk_key],
                     key=gk_key,
                     help=f"Maximum goalkeepers from {team}. Low values may cause optimization to fail.",
                     on_change=on_position_limit_change
@@ -439,7 +510,7 @@ def create_optimizer_page(players_df):
         all_teams_list = sorted(players_df['team'].unique().tolist()) if players_df is not None else []
         
         def on_teams_change():
-            st.session_state.last_user_interaction = time.time()
+            ss.last_user_interaction = time.time()
         
         selected_teams = st.multiselect(
             "Select teams", 
@@ -493,23 +564,24 @@ def create_optimizer_page(players_df):
     # Optimize button
     if st.sidebar.button("🚀 Optimize Squad", type="primary"):
         # Track user interaction to prevent auto-refresh conflicts
-        st.session_state.last_user_interaction = time.time()
+        ss.last_user_interaction = time.time()
         
-        # Filter data based on user selections
-        filtered_df = players_df.copy()
+        # Filter data based on user selections with a single combined mask
+        mask = np.ones(len(players_df), dtype=bool)
         
         if excluded_teams:
-            filtered_df = filtered_df[~filtered_df['team'].isin(excluded_teams)]
+            mask &= ~players_df['team'].isin(excluded_teams).to_numpy()
         
         # Remove manually excluded players
-        if st.session_state.manually_excluded_players:
-            excluded_indices = [p['index'] for p in st.session_state.manually_excluded_players]
-            filtered_df = filtered_df[~filtered_df.index.isin(excluded_indices)]
+        if len(ss.excluded_index):
+            mask &= ~players_df.index.isin(ss.excluded_index)
+        
+        filtered_df = players_df.loc[mask]
         
         with st.spinner("🤖 Finding optimal squad..."):
-            # Load optimizer with enhanced settings
-            optimizer = load_optimizer(budget)
-            optimizer.min_budget_usage = min_budget_usage
+            # Fresh optimizer per run (cheap; the models are cached), so concurrent
+            # sessions never see each other's settings
+            optimizer = _new_optimizer(budget=budget, min_budget_usage=min_budget_usage)
             
             # Set FDR weights if enabled
             if use_fdr:
@@ -522,45 +594,74 @@ def create_optimizer_page(players_df):
             else:
                 optimizer.use_fdr = False
             
-            # Set team requirements
-            if team_reqs:
-                optimizer.set_team_requirements(team_reqs)
-            
-            # Set team position limits
-            if team_pos_limits:
-                optimizer.set_team_position_limits(team_pos_limits)
+            # Set team requirements and team position limits (empty dicts clear them)
+            optimizer.set_team_requirements(team_reqs)
+            optimizer.set_team_position_limits(team_pos_limits)
             
             # Set expensive player thresholds
             optimizer.expensive_threshold = expensive_threshold
             optimizer.very_expensive_threshold = very_expensive_threshold
             optimizer.max_expensive_bench = max_expensive_bench
             
-            # Load model and predict points
-            optimizer.load_model()
-            predicted_df = optimizer.predict_points(filtered_df)
+            # Predict points only when the candidate pool or FDR settings changed; budget and
+            # other MILP-only tweaks (team limits, ...) reuse the cached predictions
+            predicted_df = _cached_predictions(
+                int(hash_pandas_object(filtered_df).sum()),
+                optimizer.use_fdr,
+                tuple(sorted(optimizer.fdr_weights.items())) if optimizer.use_fdr else None,
+                filtered_df
+            )
             
-            # Handle manually selected players
-            if st.session_state.manually_selected_players:
-                # Force include manually selected players
-                manual_player_indices = [p['index'] for p in st.session_state.manually_selected_players]
-                
-                # Update optimizer to handle manual selections
-                optimizer.manually_selected_players = manual_player_indices
+            # Force include manually selected players (an empty list clears them)
+            optimizer.manually_selected_players = list(sel_idx_set)
             
             # Run optimization
             results = optimizer.optimize_squad(predicted_df)
         
         # Store results in session state
-        st.session_state.optimization_results = results
+        ss.optimization_results = results
         
         # Display results
         if results['status'] == 'optimal':
             st.success("✅ Optimization completed successfully!")
             
             selected_players = results['selected_players']
-            starting_players = results['starting_players']
             bench_players = results['bench_players']
             
+            # Display slices for the result tabs
+            display_squad = selected_players[_SQUAD_COLS]
+            display_starting = results['starting_players'][_LINEUP_COLS]
+            display_bench = bench_players[_LINEUP_COLS]
+            position_df = DataFrame(
+                list(results['position_breakdown'].items()), columns=['Position', 'Count']
+            )
+            team_df = DataFrame.from_records(
+                sorted(results['team_breakdown'].items(), key=lambda kv: -kv[1]),
+                columns=('Team', 'Players')
+            )
+            
+            # Settings applied for this run, as (Setting, Value) records
+            settings_data = (
+                ('Budget', f'£{budget}m'),
+                ('Min Budget Usage', f'{min_budget_usage*100:.0f}%'),
+                ('FDR Enabled', 'Yes' if use_fdr else 'No'),
+                ('Team Requirements', str(team_reqs) if team_reqs else 'None'),
+            ) + _STATIC_SETTINGS_ROWS + (
+                ('Manual Selections', f'{n_sel} players' if n_sel else 'None'),
+                ('Manual Exclusions', f'{n_exc} players' if n_exc else 'None'),
+            ) + ((
+                ('FDR Attack Weight', f'{fdr_attack_weight:.2f}'),
+                ('FDR Defence Weight', f'{fdr_defence_weight:.2f}'),
+                ('FDR Overall Weight', f'{fdr_overall_weight:.2f}'),
+            ) if use_fdr else ()) + ((
+                ('Team Position Limits', f'{len(team_pos_limits)} teams'),
+            ) if team_pos_limits else ()) + (
+                # Expensive player settings
+                ('Expensive Player Threshold', f'£{expensive_threshold}m'),
+                ('Very Expensive Threshold', f'£{very_expensive_threshold}m'),
+                ('Max Expensive on Bench', str(max_expensive_bench)),
+            )
+            
             # Create tabs for different views
             tab1, tab2, tab3, tab4, tab5 = st.tabs([
                 "🏆 Squad Overview", 
@@ -571,188 +672,43 @@ def create_optimizer_page(players_df):
             ])
             
             with tab1:
-                st.header("Complete Squad")
-                
-                # Key metrics
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Total Cost", f"£{results['total_cost']:.1f}m")
-                
-                with col2:
-                    st.metric("Predicted Points", f"{results['total_predicted_points']:.1f}")
-                
-                with col3:
-                    st.metric("Budget Usage", f"{results['budget_usage_pct']:.1f}%")
-                
-                with col4:
-                    st.metric("Remaining Budget", f"£{results['remaining_budget']:.1f}m")
-                
-                # Full squad table
-                st.dataframe(
-                    selected_players[['name', 'position', 'team', 'cost', 'predicted_points', 'form', 'total_points']],
-                    column_config={
-                        "name": st.column_config.TextColumn("Player"),
-                        "position": st.column_config.TextColumn("Position"),
-                        "team": st.column_config.TextColumn("Team"),
-                        "cost": st.column_config.NumberColumn("Cost (£m)", format="%.1f"),
-                        "predicted_points": st.column_config.NumberColumn("Predicted Points", format="%.1f"),
-                        "form": st.column_config.NumberColumn("Form", format="%.1f"),
-                        "total_points": st.column_config.NumberColumn("Season Points", format="%d")
-                    },
-                    use_container_width=True,
-                    hide_index=True
-                )
+                _display_squad_overview(results, display_squad)
             
             with tab2:
-                st.header("Starting XI")
-                st.write(f"**Predicted Points: {results['starting_predicted_points']:.1f}**")
-                
-                # Starting formation display
-                formation = results.get('formation', 'Unknown')
-                st.subheader(f"Formation: {formation}")
-                
-                # Starting XI table
-                st.dataframe(
-                    starting_players[['name', 'position', 'team', 'cost', 'predicted_points', 'form']],
-                    column_config={
-                        "name": st.column_config.TextColumn("Player"),
-                        "position": st.column_config.TextColumn("Position"),
-                        "team": st.column_config.TextColumn("Team"),
-                        "cost": st.column_config.NumberColumn("Cost (£m)", format="%.1f"),
-                        "predicted_points": st.column_config.NumberColumn("Predicted Points", format="%.1f"),
-                        "form": st.column_config.NumberColumn("Form", format="%.1f")
-                    },
-                    use_container_width=True,
-                    hide_index=True
-                )
+                _display_starting_xi(results, display_starting)
             
             with tab3:
-                st.header("Bench Players")
-                st.write(f"**Bench Value: £{bench_players['cost'].sum():.1f}m**")
-                
-                # Bench table
-                st.dataframe(
-                    bench_players[['name', 'position', 'team', 'cost', 'predicted_points', 'form']],
-                    column_config={
-                        "name": st.column_config.TextColumn("Player"),
-                        "position": st.column_config.TextColumn("Position"), 
-                        "team": st.column_config.TextColumn("Team"),
-                        "cost": st.column_config.NumberColumn("Cost (£m)", format="%.1f"),
-                        "predicted_points": st.column_config.NumberColumn("Predicted Points", format="%.1f"),
-                        "form": st.column_config.NumberColumn("Form", format="%.1f")
-                    },
-                    use_container_width=True,
-                    hide_index=True
-                )
+                _display_bench(bench_players, display_bench)
             
             with tab4:
-                st.header("Squad Statistics")
-                
-                # Position breakdown
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.subheader("Position Breakdown")
-                    position_df = pd.DataFrame(list(results['position_breakdown'].items()), 
-                                             columns=['Position', 'Count'])
-                    st.dataframe(position_df, hide_index=True, use_container_width=True)
-                
-                with col2:
-                    st.subheader("Team Breakdown")
-                    team_df = pd.DataFrame(list(results['team_breakdown'].items()), 
-                                         columns=['Team', 'Players'])
-                    team_df = team_df.sort_values('Players', ascending=False)
-                    st.dataframe(team_df, hide_index=True, use_container_width=True)
+                _display_squad_statistics(position_df, team_df)
             
             with tab5:
-                st.header("Optimization Details")
-                
-                # Settings applied
-                st.subheader("Settings Applied")
-                settings_data = [
-                    ['Budget', f'£{budget}m'],
-                    ['Min Budget Usage', f'{min_budget_usage*100:.0f}%'],
-                    ['FDR Enabled', 'Yes' if use_fdr else 'No'],
-                    ['Team Requirements', str(team_reqs) if team_reqs else 'None'],
-                    ['Max per Team', f'{3} players'],
-                    ['Manual Selections', f'{len(st.session_state.manually_selected_players)} players' if st.session_state.manually_selected_players else 'None'],
-                    ['Manual Exclusions', f'{len(st.session_state.manually_excluded_players)} players' if st.session_state.manually_excluded_players else 'None']
-                ]
-                
-                if use_fdr:
-                    settings_data.extend([
-                        ['FDR Attack Weight', f'{fdr_attack_weight:.2f}'],
-                        ['FDR Defence Weight', f'{fdr_defence_weight:.2f}'],
-                        ['FDR Overall Weight', f'{fdr_overall_weight:.2f}']
-                    ])
-                
-                if team_pos_limits:
-                    settings_data.append(['Team Position Limits', f'{len(team_pos_limits)} teams'])
-                
-                # Add expensive player settings
-                settings_data.extend([
-                    ['Expensive Player Threshold', f'£{expensive_threshold}m'],
-                    ['Very Expensive Threshold', f'£{very_expensive_threshold}m'],
-                    ['Max Expensive on Bench', str(max_expensive_bench)]
-                ])
-                
-                settings_df = pd.DataFrame(settings_data, columns=['Setting', 'Value'])
-                st.dataframe(settings_df, hide_index=True, use_container_width=True)
-                
-                # Constraints summary
-                st.subheader("Constraints Applied")
-                constraints_df = pd.DataFrame({
-                    'Constraint': [
-                        'Total Budget',
-                        'Squad Size',
-                        'Goalkeepers',
-                        'Defenders',
-                        'Midfielders',
-                        'Forwards',
-                        'Max per Team'
-                    ],
-                    'Requirement': [
-                        f'≤ £{budget}m',
-                        '= 15 players',
-                        '= 2 players',
-                        '= 5 players',
-                        '= 5 players',
-                        '= 3 players',
-                        '≤ 3 players'
-                    ],
-                    'Actual': [
-                        f'£{results["total_cost"]:.1f}m',
-                        f'{len(selected_players)} players',
-                        f'{results["position_breakdown"].get("Goalkeeper", 0)} players',
-                        f'{results["position_breakdown"].get("Defender", 0)} players',
-                        f'{results["position_breakdown"].get("Midfielder", 0)} players',
-                        f'{results["position_breakdown"].get("Forward", 0)} players',
-                        f'{max(results["team_breakdown"].values())} players'
-                    ]
-                })
-                
-                st.dataframe(constraints_df, hide_index=True, use_container_width=True)
+                _display_settings_applied(results, settings_data, budget)
         else:
             st.error("❌ Optimization failed!")
             st.error(results.get('message', 'No feasible solution found'))
             
             # Display debug information
             st.subheader("Debug Information")
-            st.write("**Applied Constraints:**")
-            st.write(f"- Budget: £{budget}m")
-            st.write(f"- Min Budget Usage: {min_budget_usage*100:.0f}%")
-            st.write(f"- Excluded Teams: {excluded_teams}")
-            if st.session_state.manually_selected_players:
-                st.write(f"- Manual Selections: {len(st.session_state.manually_selected_players)} players")
-            if st.session_state.manually_excluded_players:
-                st.write(f"- Manual Exclusions: {len(st.session_state.manually_excluded_players)} players")
+            # Collect the lines and render them as one markdown element
+            debug_lines = [
+                "**Applied Constraints:**",
+                "",
+                f"- Budget: £{budget}m",
+                f"- Min Budget Usage: {min_budget_usage*100:.0f}%",
+                f"- Excluded Teams: {excluded_teams}",
+            ]
+            if n_sel:
+                debug_lines.append(f"- Manual Selections: {n_sel} players")
+            if n_exc:
+                debug_lines.append(f"- Manual Exclusions: {n_exc} players")
             if team_reqs:
-                st.write(f"- Team Requirements: {team_reqs}")
+                debug_lines.append(f"- Team Requirements: {team_reqs}")
             if team_pos_limits:
-                st.write(f"- Team Position Limits: {len(team_pos_limits)} teams")
-                for team, limits in team_pos_limits.items():
-                    st.write(f"  - {team}: {limits}")
+                debug_lines.append(f"- Team Position Limits: {len(team_pos_limits)} teams")
+                debug_lines.extend(f"  - {team}: {limits}" for team, limits in team_pos_limits.items())
+            st.markdown("\n".join(debug_lines))
             
             # Suggestions for fixing the issue
             st.info("💡 **Try relaxing some constraints or increasing the budget:**")
@@ -764,7 +720,7 @@ def create_optimizer_page(players_df):
             if min_budget_usage > 0.95:
                 suggestions.append("• **Budget Usage**: Try reducing minimum budget usage below 95%")
             
-            if st.session_state.manually_selected_players:
+            if n_sel:
                 suggestions.append("• **Manual Selections**: Try removing some manually selected players")
             
             if team_reqs:
@@ -776,11 +732,126 @@ def create_optimizer_page(players_df):
             if not suggestions:
                 suggestions.append("• Try increasing the budget or reducing other constraints")
             
-            for suggestion in suggestions:
-                st.write(suggestion)
+            st.markdown("\n\n".join(suggestions))
             
             st.info("💡 Try relaxing some constraints or increasing the budget.")
 
+def _display_squad_overview(results, display_squad):
+    """Display the complete squad tab"""
+    st.header("Complete Squad")
+    
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Cost", f"£{results['total_cost']:.1f}m")
+    
+    with col2:
+        st.metric("Predicted Points", f"{results['total_predicted_points']:.1f}")
+    
+    with col3:
+        st.metric("Budget Usage", f"{results['budget_usage_pct']:.1f}%")
+    
+    with col4:
+        st.metric("Remaining Budget", f"£{results['remaining_budget']:.1f}m")
+    
+    # Full squad table
+    st.dataframe(
+        display_squad,
+        column_config=_SQUAD_COLCFG,
+        use_container_width=True,
+        hide_index=True
+    )
+
+def _display_starting_xi(results, display_starting):
+    """Display the starting XI tab"""
+    st.header("Starting XI")
+    st.write(f"**Predicted Points: {results['starting_predicted_points']:.1f}**")
+    
+    # Starting formation display
+    formation = results.get('formation', 'Unknown')
+    st.subheader(f"Formation: {formation}")
+    
+    # Starting XI table
+    st.dataframe(
+        display_starting,
+        column_config=_BASE_COLCFG,
+        use_container_width=True,
+        hide_index=True
+    )
+
+def _display_bench(bench_players, display_bench):
+    """Display the bench tab"""
+    st.header("Bench Players")
+    st.write(f"**Bench Value: £{bench_players['cost'].sum():.1f}m**")
+    
+    # Bench table
+    st.dataframe(
+        display_bench,
+        column_config=_BASE_COLCFG,
+        use_container_width=True,
+        hide_index=True
+    )
+
+def _display_squad_statistics(position_df, team_df):
+    """Display the position and team breakdown tab"""
+    st.header("Squad Statistics")
+    
+    # Position breakdown
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Position Breakdown")
+        st.dataframe(position_df, hide_index=True, use_container_width=True)
+    
+    with col2:
+        st.subheader("Team Breakdown")
+        st.dataframe(team_df, hide_index=True, use_container_width=True)
+
+def _display_settings_applied(results, settings_data, budget):
+    """Display the settings and constraints applied to the last optimization"""
+    st.header("Optimization Details")
+    
+    # Settings applied
+    st.subheader("Settings Applied")
+    settings_df = DataFrame.from_records(settings_data, columns=('Setting', 'Value'))
+    # Static tables render as plain st.table (label column as index instead of a row number)
+    st.table(settings_df.set_index('Setting'))
+    
+    # Constraints summary
+    st.subheader("Constraints Applied")
+    constraints_df = DataFrame({
+        'Constraint': [
+            'Total Budget',
+            'Squad Size',
+            'Goalkeepers',
+            'Defenders',
+            'Midfielders',
+            'Forwards',
+            'Max per Team'
+        ],
+        'Requirement': [
+            f'≤ £{budget}m',
+            '= 15 players',
+            '= 2 players',
+            '= 5 players',
+            '= 5 players',
+            '= 3 players',
+            '≤ 3 players'
+        ],
+        'Actual': [
+            f'£{results["total_cost"]:.1f}m',
+            f'{results["squad_size"]} players',
+            f'{results["position_counts"]["Goalkeeper"]} players',
+            f'{results["position_counts"]["Defender"]} players',
+            f'{results["position_counts"]["Midfielder"]} players',
+            f'{results["position_counts"]["Forward"]} players',
+            f'{results["max_per_team_actual"]} players'
+        ]
+    })
+    
+    st.table(constraints_df.set_index('Constraint'))
+
 def optimize_squad_advanced(players_df, budget, constraints=None):
     """
     Advanced squad optimization with custom constraints
@@ -794,7 +865,7 @@ def optimize_squad_advanced(players_df, budget, constraints=None):
         Dictionary containing optimization results
     """
     try:
-        optimizer = FPLOptimizer(budget=budget)
+        optimizer = _new_optimizer(budget=budget)
         
         # Apply any additional constraints if provided
         if constraints:
@@ -803,8 +874,7 @@ def optimize_squad_advanced(players_df, budget, constraints=None):
             if 'position_limits' in constraints:
                 optimizer.set_team_position_limits(constraints['position_limits'])
         
-        # Load model and predict points
-        optimizer.load_model()
+        # Predict points with the shared cached models
         predicted_df = optimizer.predict_points(players_df)
         
         # Run optimization
@@ -866,7 +936,7 @@ def validate_squad_constraints(selected_players):
     """
     if isinstance(selected_players, list):
         # Convert list to DataFrame if needed
-        selected_players = pd.DataFrame(selected_players)
+        selected_players = DataFrame(selected_players)
     
     validation = {
         'valid': True,
@@ -7,10 +7,11 @@ Handles logic for evaluating the next three gameweeks (fixtures, points potentia
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
+from pandas.util import hash_pandas_object
 import sys
 import os
-import time
+
+from utils import navigate_to
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -20,6 +21,61 @@ try:
 except ImportError:
     st.error("Could not import FPLOptimizer module.")
 
+from FPL_Squad_Optimizer import load_prediction_models
+
+# Recommendation card templates; each grid joins its cards and renders them with one st.markdown call
+_POSITION_CARD_TEMPLATE = (
+    "<div style='background: linear-gradient(90deg, {start}, {end}); color: {text}; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>"
+    "<h4 style='margin: 0; color: {text};'>{rank}. {name} {form_indicator} {minutes_indicator}</h4>"
+    "<p style='margin: 0.2rem 0;'>£{cost:.1f}m | Form: {form:.1f} | Ownership: {ownership:.1f}%</p>"
+    "<p style='margin: 0.2rem 0; font-size: 0.9em;'>🤖 <strong>ML Prediction:</strong> {prediction:.1f} pts | ICT: {ict:.0f}</p>"
+    "<p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {team} | Minutes: {minutes} | Confidence: {confidence:.2f}</p>"
+    "</div>"
+)
+
+# (gradient start, gradient end, text colour) per position block
+_POSITION_CARD_COLOURS = {
+    'forwards': ('#37003c', '#5a0066', 'white'),
+    'defenders': ('#00ff87', '#04f5ff', '#37003c'),
+    'midfielders': ('#e90052', '#ff6b9d', 'white'),
+    'goalkeepers': ('#1a237e', '#283593', 'white'),
+}
+
+_CAPTAIN_CARD_TEMPLATE = (
+    "<div style='background-color: rgba(0, 255, 135, 0.1); padding: 1.5rem; border-radius: 0.5rem; margin-bottom: 1rem; border: 2px solid #00ff87;'>"
+    "<h3 style='margin: 0; color: #37003c;'>#{rank} {name} {form_indicator} {minutes_indicator}</h3>"
+    "<p style='margin: 0.3rem 0; color: #666;'>{team} | £{cost:.1f}m</p>"
+    "<p style='margin: 0.3rem 0; color: #37003c; font-weight: bold;'>Form: {form:.1f} | Predicted: {predicted}</p>"
+    "<p style='margin: 0.3rem 0; color: #888; font-size: 0.9em;'>Ownership: {ownership:.1f}% | Minutes: {minutes}</p>"
+    "<p style='margin: 0.3rem 0; color: #999; font-size: 0.8em;'>Score: {score} | Season: {season}</p>"
+    "</div>"
+)
+
+# Column order of the best fixture teams table
+_BEST_TEAMS_COLUMNS = ('Rank', 'Team', 'Next Opponent', 'Home/Away', 'Overall FDR', 'Attack FDR', 'Defence FDR', 'Fixtures')
+
+# FDR columns stay numeric (sortable) and are formatted to one decimal by the frontend
+_FDR_COLCFG = {
+    col: st.column_config.NumberColumn(col, format="%.1f")
+    for col in ('Overall FDR', 'Attack FDR', 'Defence FDR')
+}
+
+@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes
+def _cached_predictions(players_hash, _players_df):
+    """Predict points once per distinct player pool (keyed on players_hash)"""
+    if 'predicted_points' in _players_df.columns:
+        return _players_df.copy()
+    # Default-settings optimizer (the optimizer page's shared one carries user FDR settings)
+    # reusing the process-wide prediction models instead of loading them again
+    optimizer = FPLOptimizer()
+    optimizer.model, optimizer.ensemble_predictor, optimizer.advanced_models_loaded = load_prediction_models()
+    return optimizer.predict_points(_players_df.copy())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_fixture_analysis(players_hash, _players_df):
+    """Run the next-3-gameweeks analysis once per distinct player pool (keyed on players_hash)"""
+    return FPLOptimizer().analyze_next_3_gameweeks(_players_df.copy())
+
 def create_fixtures_page(players_df):
     """Create the Next 3 Gameweeks fixtures analysis page"""
     st.title("🗓️ Next 3 Gameweeks Analysis")
@@ -28,50 +84,25 @@ def create_fixtures_page(players_df):
     # Navigation button to other pages
     col1, col2, col3, col4, col5 = st.columns(5)
     with col3:
-        if st.button("🚀 Back to Optimizer", key="goto_optimizer_from_fixtures"):
-            st.session_state.current_page = 'optimizer'
-            st.session_state.last_user_interaction = time.time()  # Track user interaction
-            st.rerun()
+        st.button("🚀 Back to Optimizer", key="goto_optimizer_from_fixtures", on_click=navigate_to, args=('optimizer',))
     
     st.divider()
     
-    # Initialize optimizer for fixture analysis (with caching)
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def get_optimizer_predictions(players_data_hash):
-        """Cache expensive optimizer operations"""
-        optimizer = FPLOptimizer()
-        
-        # Load model once
-        optimizer.load_model()
-        
-        # Predict points if needed
-        if 'predicted_points' not in players_df.columns:
-            players_df_with_predictions = optimizer.predict_points(players_df.copy())
-        else:
-            players_df_with_predictions = players_df.copy()
-        
-        return players_df_with_predictions, optimizer
-    
-    # Create hash of player data to detect changes
-    import hashlib
-    players_data_str = str(players_df.values.tobytes())
-    players_hash = hashlib.md5(players_data_str.encode()).hexdigest()
+    # Content hash of the player data to detect changes (stable across reruns, unlike
+    # hashing the raw object-array bytes, which embed per-object memory addresses)
+    players_hash = int(hash_pandas_object(players_df).sum())
     
-    # Get cached predictions and optimizer
+    # Get cached predictions (models are shared with the optimizer page)
     try:
-        players_df, optimizer = get_optimizer_predictions(players_hash)
+        with st.spinner("🤖 Loading prediction models..."):
+            players_df = _cached_predictions(players_hash, players_df)
     except Exception as e:
         st.error(f"❌ Error loading model or predicting points: {str(e)}")
         return
     
-    @st.cache_data(ttl=300)  # Cache fixture analysis for 5 minutes
-    def get_fixture_analysis(players_hash, optimizer_state):
-        """Cache expensive fixture analysis"""
-        return optimizer.analyze_next_3_gameweeks(players_df)
-    
     with st.spinner("🔍 Analyzing upcoming fixtures and player recommendations..."):
         try:
-            fixture_analysis = get_fixture_analysis(players_hash, "cached")
+            fixture_analysis = _cached_fixture_analysis(players_hash, players_df)
         except Exception as e:
             st.error(f"❌ Error analyzing fixtures: {str(e)}")
             st.info("💡 This might be due to missing fixture data. Please try refreshing the player data.")
@@ -467,6 +498,45 @@ def apply_fpl_constraints(fixture_analysis, players_df):
     
     return filtered_recommendations
 
+def _position_card(rank, player, position):
+    """Render one position recommendation card as HTML"""
+    form = player.get('form', 0)
+    minutes = player.get('minutes', 0)
+    # Goalkeepers use their own (stricter) eligibility thresholds
+    if position == 'goalkeepers':
+        form_indicator = "🔥" if form > 2.0 else "📈" if form > 0 else "💤"
+        minutes_indicator = "⭐" if minutes > 1000 else "✅" if minutes > 500 else "⚠️"
+    else:
+        form_indicator = "🔥" if form > 3.0 else "📈" if form > 0 else "💤"
+        minutes_indicator = "⭐" if minutes > 500 else "✅" if minutes > 100 else "⚠️"
+    
+    start, end, text = _POSITION_CARD_COLOURS[position]
+    return _POSITION_CARD_TEMPLATE.format(
+        start=start, end=end, text=text, rank=rank, name=player['name'],
+        form_indicator=form_indicator, minutes_indicator=minutes_indicator,
+        cost=player['cost'], form=player['form'],
+        ownership=player.get('selected_by_percent', 0),
+        prediction=player.get('next_3gw_prediction', 0),
+        ict=player.get('ict_index', 0), team=player['team'], minutes=minutes,
+        confidence=player.get('manager_confidence', 1.0)
+    )
+
+def _captain_card(rank, player):
+    """Render one captain pick card as HTML"""
+    form = player.get('form', 0)
+    minutes = player.get('minutes', 0)
+    form_indicator = "🔥" if form > 5.0 else "📈" if form > 3.0 else "⚡" if form > 0 else "💤"
+    minutes_indicator = "⭐" if minutes > 1000 else "✅" if minutes > 500 else "⚠️"
+    
+    return _CAPTAIN_CARD_TEMPLATE.format(
+        rank=rank, name=player['name'],
+        form_indicator=form_indicator, minutes_indicator=minutes_indicator,
+        team=player['team'], cost=player['cost'], form=player['form'],
+        predicted=player.get('predicted_points', 'N/A'),
+        ownership=player.get('selected_by_percent', 0), minutes=minutes,
+        score=player.get('fixture_score', 'N/A'), season=player.get('total_points', 'N/A')
+    )
+
 def _display_position_recommendations(filtered_recommendations):
     """Display position-specific recommendations with FPL constraints applied"""
     st.subheader("🎯 Position-Specific Recommendations (Next 3 GWs)")
@@ -513,19 +583,10 @@ def _display_position_recommendations(filtered_recommendations):
         st.markdown("### ⚽ **FORWARDS** (Best attacking fixtures)")
         forwards = filtered_recommendations['position_recommendations']['forwards']
         if forwards:
-            for i, player in enumerate(forwards, 1):
-                # Add eligibility indicators
-                form_indicator = "🔥" if player.get('form', 0) > 3.0 else "📈" if player.get('form', 0) > 0 else "💤"
-                minutes_indicator = "⭐" if player.get('minutes', 0) > 500 else "✅" if player.get('minutes', 0) > 100 else "⚠️"
-                
-                st.markdown(f"""
-                <div style='background: linear-gradient(90deg, #37003c, #5a0066); color: white; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>
-                    <h4 style='margin: 0; color: white;'>{i}. {player['name']} {form_indicator} {minutes_indicator}</h4>
-                    <p style='margin: 0.2rem 0;'>£{player['cost']:.1f}m | Form: {player['form']:.1f} | Ownership: {player.get('selected_by_percent', 0):.1f}%</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>🤖 <strong>ML Prediction:</strong> {player.get('next_3gw_prediction', 0):.1f} pts | ICT: {player.get('ict_index', 0):.0f}</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {player['team']} | Minutes: {player.get('minutes', 0)} | Confidence: {player.get('manager_confidence', 1.0):.2f}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(
+                "".join(_position_card(i, player, 'forwards') for i, player in enumerate(forwards, 1)),
+                unsafe_allow_html=True
+            )
         else:
             st.info("No forward recommendations available")
     
@@ -533,19 +594,10 @@ def _display_position_recommendations(filtered_recommendations):
         st.markdown("### 🛡️ **DEFENDERS** (Best defensive fixtures)")
         defenders = filtered_recommendations['position_recommendations']['defenders']
         if defenders:
-            for i, player in enumerate(defenders, 1):
-                # Add eligibility indicators
-                form_indicator = "🔥" if player.get('form', 0) > 3.0 else "📈" if player.get('form', 0) > 0 else "💤"
-                minutes_indicator = "⭐" if player.get('minutes', 0) > 500 else "✅" if player.get('minutes', 0) > 100 else "⚠️"
-                
-                st.markdown(f"""
-                <div style='background: linear-gradient(90deg, #00ff87, #04f5ff); color: #37003c; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>
-                    <h4 style='margin: 0; color: #37003c;'>{i}. {player['name']} {form_indicator} {minutes_indicator}</h4>
-                    <p style='margin: 0.2rem 0;'>£{player['cost']:.1f}m | Form: {player['form']:.1f} | Ownership: {player.get('selected_by_percent', 0):.1f}%</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>🤖 <strong>ML Prediction:</strong> {player.get('next_3gw_prediction', 0):.1f} pts | ICT: {player.get('ict_index', 0):.0f}</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {player['team']} | Minutes: {player.get('minutes', 0)} | Confidence: {player.get('manager_confidence', 1.0):.2f}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(
+                "".join(_position_card(i, player, 'defenders') for i, player in enumerate(defenders, 1)),
+                unsafe_allow_html=True
+            )
         else:
             st.info("No defender recommendations available")
     
@@ -553,23 +605,13 @@ def _display_position_recommendations(filtered_recommendations):
     st.markdown("### 🎨 **MIDFIELDERS** (Best attacking fixtures)")
     midfielders = filtered_recommendations['position_recommendations']['midfielders']
     if midfielders:
-        # Create 2 columns for midfielders to display 5 players nicely
+        # Create 2 columns for midfielders to display 5 players nicely (cards alternate between them)
+        cards = [_position_card(i, player, 'midfielders') for i, player in enumerate(midfielders, 1)]
         mid_col1, mid_col2 = st.columns(2)
-        for i, player in enumerate(midfielders, 1):
-            # Add eligibility indicators
-            form_indicator = "🔥" if player.get('form', 0) > 3.0 else "📈" if player.get('form', 0) > 0 else "💤"
-            minutes_indicator = "⭐" if player.get('minutes', 0) > 500 else "✅" if player.get('minutes', 0) > 100 else "⚠️"
-            
-            # Alternate between columns
-            with mid_col1 if i % 2 == 1 else mid_col2:
-                st.markdown(f"""
-                <div style='background: linear-gradient(90deg, #e90052, #ff6b9d); color: white; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>
-                    <h4 style='margin: 0; color: white;'>{i}. {player['name']} {form_indicator} {minutes_indicator}</h4>
-                    <p style='margin: 0.2rem 0;'>£{player['cost']:.1f}m | Form: {player['form']:.1f} | Ownership: {player.get('selected_by_percent', 0):.1f}%</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>🤖 <strong>ML Prediction:</strong> {player.get('next_3gw_prediction', 0):.1f} pts | ICT: {player.get('ict_index', 0):.0f}</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {player['team']} | Minutes: {player.get('minutes', 0)} | Confidence: {player.get('manager_confidence', 1.0):.2f}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        with mid_col1:
+            st.markdown("".join(cards[0::2]), unsafe_allow_html=True)
+        with mid_col2:
+            st.markdown("".join(cards[1::2]), unsafe_allow_html=True)
     else:
         st.info("No midfielder recommendations available")
     
@@ -577,23 +619,13 @@ def _display_position_recommendations(filtered_recommendations):
     st.markdown("### 🥅 **GOALKEEPERS** (Best clean sheet chances)")
     goalkeepers = filtered_recommendations['position_recommendations']['goalkeepers']
     if goalkeepers:
-        # Create 2 columns for goalkeepers to display 5 players nicely
+        # Create 2 columns for goalkeepers to display 5 players nicely (cards alternate between them)
+        cards = [_position_card(i, player, 'goalkeepers') for i, player in enumerate(goalkeepers, 1)]
         gk_col1, gk_col2 = st.columns(2)
-        for i, player in enumerate(goalkeepers, 1):
-            # Add eligibility indicators for GKs
-            form_indicator = "🔥" if player.get('form', 0) > 2.0 else "📈" if player.get('form', 0) > 0 else "💤"
-            minutes_indicator = "⭐" if player.get('minutes', 0) > 1000 else "✅" if player.get('minutes', 0) > 500 else "⚠️"
-            
-            # Alternate between columns
-            with gk_col1 if i % 2 == 1 else gk_col2:
-                st.markdown(f"""
-                <div style='background: linear-gradient(90deg, #1a237e, #283593); color: white; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>
-                    <h4 style='margin: 0; color: white;'>{i}. {player['name']} {form_indicator} {minutes_indicator}</h4>
-                    <p style='margin: 0.2rem 0;'>£{player['cost']:.1f}m | Form: {player['form']:.1f} | Ownership: {player.get('selected_by_percent', 0):.1f}%</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>🤖 <strong>ML Prediction:</strong> {player.get('next_3gw_prediction', 0):.1f} pts | ICT: {player.get('ict_index', 0):.0f}</p>
-                    <p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {player['team']} | Minutes: {player.get('minutes', 0)} | Confidence: {player.get('manager_confidence', 1.0):.2f}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        with gk_col1:
+            st.markdown("".join(cards[0::2]), unsafe_allow_html=True)
+        with gk_col2:
+            st.markdown("".join(cards[1::2]), unsafe_allow_html=True)
     else:
         st.info("No goalkeeper recommendations available")
     
@@ -605,22 +637,23 @@ def _display_best_fixture_teams(fixture_analysis):
     st.markdown("Teams with the easiest upcoming fixtures (lower FDR is better):")
     
     if 'team_analysis' in fixture_analysis:
-        # Best teams analysis
-        best_teams_data = []
-        for i, team_data in enumerate(fixture_analysis['team_analysis'][:8]):
-            best_teams_data.append({
-                'Rank': i + 1,
-                'Team': team_data['team'],
-                'Next Opponent': team_data.get('next_opponent', 'N/A'),
-                'Home/Away': team_data.get('home_away', 'N/A'),
-                'Overall FDR': f"{team_data.get('fdr_overall', 0):.1f}",
-                'Attack FDR': f"{team_data.get('fdr_attack', 0):.1f}",
-                'Defence FDR': f"{team_data.get('fdr_defence', 0):.1f}",
-                'Fixtures': team_data.get('fixtures_count', 0)
-            })
-        
-        best_teams_df = pd.DataFrame(best_teams_data)
-        st.dataframe(best_teams_df, use_container_width=True, hide_index=True)
+        # Best teams analysis (row tuples, so pandas infers dtypes once per column)
+        best_teams_rows = [
+            (
+                i,
+                team_data['team'],
+                team_data.get('next_opponent', 'N/A'),
+                team_data.get('home_away', 'N/A'),
+                team_data.get('fdr_overall', 0),
+                team_data.get('fdr_attack', 0),
+                team_data.get('fdr_defence', 0),
+                team_data.get('fixtures_count', 0)
+            )
+            for i, team_data in enumerate(fixture_analysis['team_analysis'][:8], 1)
+        ]
+        
+        best_teams_df = pd.DataFrame.from_records(best_teams_rows, columns=_BEST_TEAMS_COLUMNS)
+        st.dataframe(best_teams_df, use_container_width=True, hide_index=True, column_config=_FDR_COLCFG)
     else:
         st.info("No team analysis data available")
     
@@ -638,42 +671,61 @@ def _display_fdr_rankings(fixture_analysis):
     st.markdown("All teams ranked by fixture difficulty:")
     
     if 'fdr_rankings' in fixture_analysis:
+        # Pull each column out of the rankings once; the chart takes the lists directly
+        rankings = fixture_analysis['fdr_rankings']
+        teams = [team['team'] for team in rankings]
+        overall = [team.get('fdr_overall', 0) for team in rankings]
+        attack = [team.get('fdr_attack', 0) for team in rankings]
+        defence = [team.get('fdr_defence', 0) for team in rankings]
+        opponents = [team.get('next_opponent', 'N/A') for team in rankings]
+        venues = ['Home' if team.get('next_fixture_home', False) else 'Away' for team in rankings]
+        
         # Create comprehensive FDR table
-        fdr_data = []
-        for i, team in enumerate(fixture_analysis['fdr_rankings']):
-            fdr_data.append({
-                'Rank': i + 1,
-                'Team': team['team'],
-                'Overall FDR': team.get('fdr_overall', 0),
-                'Attack FDR': team.get('fdr_attack', 0),
-                'Defence FDR': team.get('fdr_defence', 0),
-                'Next Opponent': team.get('next_opponent', 'N/A'),
-                'Venue': 'Home' if team.get('next_fixture_home', False) else 'Away'
-            })
-        
-        fdr_df = pd.DataFrame(fdr_data)
-        
-        # Create FDR visualization
-        fig = px.scatter(
-            fdr_df, 
-            x='Attack FDR', 
-            y='Defence FDR',
-            size='Overall FDR',
-            color='Overall FDR',
-            hover_name='Team',
-            hover_data=['Next Opponent', 'Venue'],
-            color_continuous_scale='RdYlGn_r',
-            title="Team FDR Analysis - Attack vs Defence Difficulty"
-        )
+        fdr_df = pd.DataFrame({
+            'Rank': range(1, len(rankings) + 1),
+            'Team': teams,
+            'Overall FDR': overall,
+            'Attack FDR': attack,
+            'Defence FDR': defence,
+            'Next Opponent': opponents,
+            'Venue': venues
+        })
+        
+        # Create FDR visualization (single graph_objects trace; bubble area scaled like px.scatter)
+        import plotly.graph_objects as go
+        fig = go.Figure(go.Scatter(
+            x=attack,
+            y=defence,
+            mode='markers',
+            marker=dict(
+                size=overall,
+                sizemode='area',
+                sizeref=2 * (max(overall, default=0) or 1) / 20 ** 2,
+                color=overall,
+                colorscale='RdYlGn_r',
+                showscale=True,
+                colorbar=dict(title='Overall FDR')
+            ),
+            text=teams,
+            customdata=list(zip(opponents, venues)),
+            hovertemplate=(
+                "<b>%{text}</b><br>Attack FDR=%{x}<br>Defence FDR=%{y}<br>"
+                "Overall FDR=%{marker.color}<br>Next Opponent=%{customdata[0]}<br>"
+                "Venue=%{customdata[1]}<extra></extra>"
+            )
+        ))
         
         fig.update_layout(
+            title="Team FDR Analysis - Attack vs Defence Difficulty",
+            xaxis_title='Attack FDR',
+            yaxis_title='Defence FDR',
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             height=500
         )
         
         st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(fdr_df, use_container_width=True, hide_index=True)
+        st.dataframe(fdr_df, use_container_width=True, hide_index=True, column_config=_FDR_COLCFG)
     else:
         st.info("No FDR rankings data available")
 
@@ -686,24 +738,13 @@ def _display_captain_picks(filtered_recommendations):
         captain_picks = filtered_recommendations['captain_picks']
         
         if captain_picks:
-            # Create captain picks grid
+            # Create captain picks grid (all filtered captain options, alternating columns)
+            cards = [_captain_card(i, player) for i, player in enumerate(captain_picks, 1)]
             cols = st.columns(2)
-            
-            for i, player in enumerate(captain_picks):  # Show all filtered captain options
-                with cols[i % 2]:
-                    # Add eligibility indicators
-                    form_indicator = "🔥" if player.get('form', 0) > 5.0 else "📈" if player.get('form', 0) > 3.0 else "⚡" if player.get('form', 0) > 0 else "💤"
-                    minutes_indicator = "⭐" if player.get('minutes', 0) > 1000 else "✅" if player.get('minutes', 0) > 500 else "⚠️"
-                    
-                    st.markdown(f"""
-                    <div style='background-color: rgba(0, 255, 135, 0.1); padding: 1.5rem; border-radius: 0.5rem; margin-bottom: 1rem; border: 2px solid #00ff87;'>
-                        <h3 style='margin: 0; color: #37003c;'>#{i+1} {player['name']} {form_indicator} {minutes_indicator}</h3>
-                        <p style='margin: 0.3rem 0; color: #666;'>{player['team']} | £{player['cost']:.1f}m</p>
-                        <p style='margin: 0.3rem 0; color: #37003c; font-weight: bold;'>Form: {player['form']:.1f} | Predicted: {player.get('predicted_points', 'N/A')}</p>
-                        <p style='margin: 0.3rem 0; color: #888; font-size: 0.9em;'>Ownership: {player.get('selected_by_percent', 0):.1f}% | Minutes: {player.get('minutes', 0)}</p>
-                        <p style='margin: 0.3rem 0; color: #999; font-size: 0.8em;'>Score: {player.get('fixture_score', 'N/A')} | Season: {player.get('total_points', 'N/A')}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            with cols[0]:
+                st.markdown("".join(cards[0::2]), unsafe_allow_html=True)
+            with cols[1]:
+                st.markdown("".join(cards[1::2]), unsafe_allow_html=True)
         else:
             st.info("No captain recommendations available")
     else:
@@ -16,16 +16,15 @@ from utils import (
     initialize_session_state, 
     apply_custom_css,
     create_navigation_sidebar,
+    get_current_page,
     load_player_data,
-    fetch_fresh_player_data,
-    get_data_freshness_info,
-    filter_available_players,
+    load_available_players,
     create_footer,
     display_error_message,
-    validate_data_quality
+    validate_player_data
 )
 
-from FPL_Squad_Optimizer import create_optimizer_page
+from FPL_Squad_Optimizer import create_optimizer_page, warm_prediction_models
 from FPL_Player_Statistics import create_stats_page
 from Next_3_Gameweeks import create_fixtures_page
 from Current_Season_Points import create_current_season_page
@@ -71,8 +70,11 @@ def main():
         st.info("Please run the following command first: `python src/fetch_fpl_data.py`")
         st.stop()
     
+    # Load the prediction models behind the user's think time instead of on the first click
+    warm_prediction_models()
+    
     # Validate data quality
-    validation_results = validate_data_quality(players_df)
+    validation_results = validate_player_data()
     if not validation_results['valid']:
         for error in validation_results['errors']:
             display_error_message(error, "error")
@@ -82,8 +84,8 @@ def main():
     for warning in validation_results['warnings']:
         display_error_message(warning, "warning")
     
-    # Filter out unavailable players
-    players_df = filter_available_players(players_df)
+    # Filter out unavailable players (cached together with the CSV load)
+    players_df = load_available_players()
     
     if players_df is None or len(players_df) == 0:
         display_error_message("No available players found after filtering!")
@@ -92,8 +94,8 @@ def main():
     # Create navigation sidebar
     create_navigation_sidebar()
     
-    # Route to appropriate page based on session state
-    current_page = st.session_state.current_page
+    # Route to appropriate page based on the ?page= query parameter
+    current_page = get_current_page()
     
     try:
         if current_page == 'stats':
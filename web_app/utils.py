@@ -6,9 +6,10 @@ Contains shared constants, helper functions, and common utilities used across th
 
 import streamlit as st
 import pandas as pd
-import numpy as np
+import functools
 import os
 import sys
+import threading
 import time
 
 # FPL Constants
@@ -44,211 +45,339 @@ FPL_COLORS = {
     'text': '#262730'
 }
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def load_player_data():
-    """Load and cache player data from CSV file with 5-minute refresh"""
+# Player card styles used by format_player_card
+_CARD_STYLE_CONFIGS = {
+    'forward': {'gradient': 'linear-gradient(90deg, #37003c, #5a0066)', 'text_color': 'white'},
+    'defender': {'gradient': 'linear-gradient(90deg, #00ff87, #04f5ff)', 'text_color': '#37003c'},
+    'midfielder': {'gradient': 'linear-gradient(90deg, #e90052, #ff6b9d)', 'text_color': 'white'},
+    'goalkeeper': {'gradient': 'linear-gradient(90deg, #04f5ff, #00bcd4)', 'text_color': 'white'},
+    'default': {'gradient': 'linear-gradient(90deg, #f0f2f6, #e0e0e0)', 'text_color': '#37003c'}
+}
+
+_PLAYER_CARD_TEMPLATE = """
+    <div style='background: {gradient}; color: {text_color}; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>
+        <h4 style='margin: 0; color: {text_color};'>{name}</h4>
+        <p style='margin: 0.2rem 0;'>£{cost:.1f}m | Form: {form:.1f} | Ownership: {ownership:.1f}%</p>
+        <p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {team} | Points: {points}</p>
+    </div>
+    """
+
+# Project paths (resolved once at import); the processed player data is written by src/fetch_fpl_data.py
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SRC_DIR = os.path.join(_PROJECT_ROOT, "src")
+_RAW_DATA_DIR = os.path.join(_PROJECT_ROOT, "data", "raw")
+_PROCESSED_DATA_DIR = os.path.join(_PROJECT_ROOT, "data", "processed")
+_PLAYER_DATA_PATH = os.path.join(_PROCESSED_DATA_DIR, "fpl_players_latest.csv")
+
+# Add src directory to path for imports (once, however many times the app reruns)
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
+
+from fetch_fpl_data import FPLDataFetcher
+
+def _read_player_csv(data_path):
+    """Read the processed player data, preferring the Parquet copy written alongside the CSV.
+    
+    The Parquet file is only used when it is at least as new as the CSV, so a CSV
+    regenerated without it is never shadowed by stale data. Otherwise the CSV is
+    parsed with pyarrow's multithreaded reader (a Streamlit dependency).
+    The Parquet file is memory-mapped rather than read into an intermediate buffer.
+    
+    After a CSV parse the Parquet copy is (re)written, so later loads skip the parse
+    even when the CSV came from somewhere other than the fetch pipeline.
+    """
+    parquet_path = os.path.splitext(data_path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(data_path):
+        return pd.read_parquet(parquet_path, engine="pyarrow", memory_map=True)
+    
+    players_df = pd.read_csv(data_path, engine="pyarrow")
+    # Write to a temporary name and swap it in, so a concurrent session never reads a partial file
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
     try:
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        data_path = os.path.join(project_root, "data", "processed", "fpl_players_latest.csv")
-        
-        if not os.path.exists(data_path):
-            return None
-        
-        return pd.read_csv(data_path)
+        players_df.to_parquet(tmp_path, engine="pyarrow", index=False)
+        os.replace(tmp_path, parquet_path)
     except Exception as e:
-        st.error(f"Error loading player data: {str(e)}")
+        print(f"Could not write Parquet copy of player data ({e}); later loads will parse the CSV")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return players_df
+
+@st.cache_resource(max_entries=1, show_spinner=False)  # One shared frame per file version
+def _load_player_data_version(data_path, mtime):
+    """Read the player data for one version of the file (mtime is only the cache key).
+    
+    cache_resource hands every caller the same frame without copying it, so callers
+    must not modify it in place.
+    """
+    return _read_player_csv(data_path)
+
+def _player_data_mtime():
+    """Modification time of the processed player data file (None if it does not exist).
+    
+    Every cache derived from the player data is keyed on this, so rewriting the file
+    invalidates them all without clearing unrelated caches.
+    """
+    try:
+        return os.path.getmtime(_PLAYER_DATA_PATH)
+    except FileNotFoundError:
         return None
 
-def load_player_data_fresh():
-    """Load player data without any caching - for immediate refresh"""
+def load_player_data():
+    """Load and cache player data, reloading only when the file's modification time changes"""
     try:
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        data_path = os.path.join(project_root, "data", "processed", "fpl_players_latest.csv")
-        
-        if not os.path.exists(data_path):
+        mtime = _player_data_mtime()
+        if mtime is None:
             return None
         
-        return pd.read_csv(data_path)
+        return _load_player_data_version(_PLAYER_DATA_PATH, mtime)
     except Exception as e:
-        st.error(f"Error loading fresh player data: {str(e)}")
+        st.error(f"Error loading player data: {str(e)}")
         return None
 
-def fetch_fresh_player_data():
-    """Fetch fresh player data from FPL API and update local file - NO CACHE"""
+def _count_data_files(dir_path, patterns):
+    """Count timestamped files per (prefix, extension) pattern in a single directory scan.
+    
+    The '<prefix>latest<extension>' copy is not counted, nor any file with another extension.
+    """
+    counts = [0] * len(patterns)
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            name = entry.name
+            for i, (prefix, extension) in enumerate(patterns):
+                if name.startswith(prefix) and name.endswith(extension) and name != f"{prefix}latest{extension}":
+                    counts[i] += 1
+    return counts
+
+# Background data refresh (one per process, shared by every session; this module stays
+# imported across reruns). 'step' is the pipeline stage currently running and 'messages'
+# the progress notes of the current/last run, shown in the sidebar's status container.
+_refresh_lock = threading.Lock()
+_refresh_state = {'thread': None, 'step': None, 'messages': [], 'error': None, 'finished_at': None}
+
+# Minimum seconds between API refreshes (FPL API etiquette; the data changes slowly anyway)
+_REFRESH_MIN_INTERVAL = 60
+
+def _refresh_note(message):
+    """Record a progress note for the sidebar status container (and the console)"""
+    _refresh_state['messages'].append(message)
+    print(f"[Background] {message}")
+
+def _run_refresh_pipeline():
+    """Fetch fresh data from the FPL API and rewrite the local files (runs off the script thread, so no st calls)"""
+    state = _refresh_state
     try:
-        import sys
-        import os
-        import time
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        sys.path.append(os.path.join(project_root, 'src'))
-        
-        from fetch_fpl_data import FPLDataFetcher
-        
-        # Clear any cached data first
-        st.cache_data.clear()
-        
-        # Show current timestamp before refresh
-        data_path = os.path.join(project_root, "data", "processed", "fpl_players_latest.csv")
-        if os.path.exists(data_path):
-            old_time = os.path.getmtime(data_path)
-            st.info(f"Before refresh: File timestamp {time.ctime(old_time)}")
-        
-        # Create fetcher and fetch fresh data
         fetcher = FPLDataFetcher()
         
         # First, clean up all old timestamped files (web app mode)
-        st.info("🧹 Cleaning up old data files...")
+        state['step'] = "🧹 Cleaning up old data files..."
         try:
             removed_count = fetcher.cleanup_all_old_files(web_app_mode=True)
             if removed_count > 0:
-                st.info(f"Cleaned up {removed_count} old files")
+                _refresh_note(f"🧹 Cleaned up {removed_count} old files")
         except Exception as e:
-            st.warning(f"Cleanup warning: {e}")
+            _refresh_note(f"⚠️ Cleanup warning: {e}")
         
-        # Show progress and run complete pipeline
-        with st.spinner("Fetching data from FPL API..."):
-            st.info("🌐 Connecting to FPL API...")
-            
-            # Run the complete pipeline with error handling
-            try:
-                fetcher.run(web_app_mode=True)  # Enable web app mode for aggressive cleanup
-                st.success("✅ Data pipeline completed successfully")
-            except Exception as e:
-                st.error(f"❌ Data pipeline failed: {str(e)}")
-                st.error("Please check your internet connection and try again.")
-                return None
+        state['step'] = "🌐 Fetching data from FPL API..."
+        fetcher.run(web_app_mode=True)  # Enable web app mode for aggressive cleanup
         
         # Verify files were created
-        raw_data_files = [f for f in os.listdir(os.path.join(project_root, "data", "raw")) if f.startswith('fpl_data_') and not f.endswith('_latest.json')]
-        fixture_files = [f for f in os.listdir(os.path.join(project_root, "data", "raw")) if f.startswith('fpl_fixtures_') and not f.endswith('_latest.json')]
-        processed_files = [f for f in os.listdir(os.path.join(project_root, "data", "processed")) if f.startswith('fpl_players_') and not f.endswith('_latest.csv')]
-        
-        st.info(f"📁 Files created: {len(raw_data_files)} data, {len(fixture_files)} fixtures, {len(processed_files)} processed")
-        
-        # Force update the file timestamp to current time (backup approach)
-        if os.path.exists(data_path):
-            # Touch the file to ensure it has current timestamp
-            os.utime(data_path, None)
-            new_time = os.path.getmtime(data_path)
-            st.info(f"After refresh: File timestamp {time.ctime(new_time)}")
-        
-        # Clear cache again to force reload
-        st.cache_data.clear()
-        
-        # Load the fresh data without cache
-        return load_player_data_fresh()
+        raw_data_count, fixture_count = _count_data_files(
+            _RAW_DATA_DIR,
+            (('fpl_data_', '.json'), ('fpl_fixtures_', '.json'))
+        )
+        processed_count, = _count_data_files(
+            _PROCESSED_DATA_DIR,
+            (('fpl_players_', '.csv'),)
+        )
+        _refresh_note(f"📁 Files created: {raw_data_count} data, {fixture_count} fixtures, {processed_count} processed")
         
-    except Exception as e:
-        st.error(f"❌ Error in refresh process: {str(e)}")
-        st.error("Please check the console for detailed error information.")
-        import traceback
-        st.text(traceback.format_exc())
-        return None
+        # Force update the file timestamp to current time (backup approach). Touching directly
+        # and catching FileNotFoundError saves a separate exists() stat per file.
+        parquet_path = os.path.splitext(_PLAYER_DATA_PATH)[0] + ".parquet"
+        try:
+            csv_mtime = os.path.getmtime(_PLAYER_DATA_PATH)
+            # The Parquet copy was rewritten by this run only if it is at least as new as the CSV;
+            # an older one (failed write) must not be touched, or it would shadow the new CSV
+            try:
+                parquet_is_current = os.path.getmtime(parquet_path) >= csv_mtime
+            except FileNotFoundError:
+                parquet_is_current = False
+            os.utime(_PLAYER_DATA_PATH, None)
+        except FileNotFoundError:
+            pass
+        else:
+            # utime(None) stamps the current time, so no stat is needed to report it
+            _refresh_note(f"🕒 After refresh: File timestamp {time.ctime()}")
+            # Keep the Parquet copy at least as new as the CSV so it is still preferred
+            if parquet_is_current:
+                os.utime(parquet_path, None)
         
+        state['error'] = None
     except Exception as e:
-        st.error(f"Could not fetch fresh data: {str(e)}")
         import traceback
-        st.error(f"Error details: {traceback.format_exc()}")
-        # Fall back to cached data
-        return load_player_data()
+        traceback.print_exc()
+        state['error'] = str(e)
+    finally:
+        state['step'] = None
+        state['finished_at'] = time.time()
+
+def is_background_refresh_running():
+    """Whether a background data refresh is currently running in this process"""
+    thread = _refresh_state['thread']
+    return thread is not None and thread.is_alive()
+
+def refresh_cooldown_remaining():
+    """Seconds until another API refresh is allowed (0 when one may start now)"""
+    finished_at = _refresh_state['finished_at']
+    if finished_at is None:
+        return 0
+    return max(0, int(_REFRESH_MIN_INTERVAL - (time.time() - finished_at)))
+
+def fetch_fresh_player_data():
+    """Start refreshing the player data from the FPL API in the background (stale-while-revalidate).
+    
+    Returns the currently cached data straight away instead of blocking the rerun for the
+    whole API fetch. At most one refresh runs per process, and a new one only starts
+    _REFRESH_MIN_INTERVAL seconds after the last finished; the sidebar picks up the result
+    on a later rerun (see _poll_background_refresh).
+    """
+    with _refresh_lock:
+        if not is_background_refresh_running() and not refresh_cooldown_remaining():
+            thread = threading.Thread(target=_run_refresh_pipeline, daemon=True)
+            _refresh_state['thread'] = thread
+            _refresh_state['step'] = "⏳ Starting refresh..."
+            _refresh_state['messages'] = []
+            thread.start()
+    return load_player_data()
+
+def _poll_background_refresh():
+    """Check for a background refresh that finished since this session last checked.
+    
+    Returns True the first time a session sees a refresh finish, so the outcome is
+    reported once.
+    """
+    finished_at = _refresh_state['finished_at']
+    # A new session only reports refreshes that finish after it started
+    seen = st.session_state.setdefault('seen_refresh_finished_at', finished_at)
+    if finished_at is None or finished_at == seen:
+        return False
+    st.session_state.seen_refresh_finished_at = finished_at
+    
+    if _refresh_state['error'] is None:
+        # The data caches are keyed on the file's mtime, so they pick up the new data by themselves
+        st.session_state.last_manual_refresh = finished_at
+    return True
+
+def _show_refresh_status(label, state, expanded=False, extra_lines=()):
+    """Show the refresh progress notes in one status container (call inside `with st.sidebar:`)"""
+    with st.status(label, state=state, expanded=expanded):
+        for line in [*_refresh_state['messages'], *extra_lines]:
+            st.write(line)
+
+@st.fragment(run_every=2)
+def _refresh_progress():
+    """Show the running refresh's progress, re-polling every 2 seconds without any user interaction.
+    
+    Once the refresh has finished, rerun the whole app so the sidebar reports the outcome
+    and the pages pick up the new data.
+    """
+    if not is_background_refresh_running():
+        st.rerun()
+    _show_refresh_status(f"🔄 Refreshing data: {_refresh_state['step'] or 'finishing up...'}", "running")
+
+# Freshness labels by age tier: under a minute, under an hour, under a day, older
+_FRESHNESS_LABELS = ("🟢 Data is fresh", "🟡 Data is recent", "🔴 Data is stale", "🔴 Data is very stale")
+
+def _format_age(total_seconds):
+    """Format an age in seconds by its two largest units ('45s', '3m 20s', '2h', '1d 3h')"""
+    if total_seconds < 60:
+        return f"{total_seconds}s"
+    days, rem = divmod(total_seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, seconds = divmod(rem, 60)
+    parts = ((days, 'd'), (hours, 'h'), (minutes, 'm'), (seconds, 's'))
+    major = 0 if days else 1 if hours else 2
+    (major_value, major_unit), (minor_value, minor_unit) = parts[major], parts[major + 1]
+    # The smaller unit is dropped when it is zero ('5m', not '5m 0s')
+    if minor_value:
+        return f"{major_value}{major_unit} {minor_value}{minor_unit}"
+    return f"{major_value}{major_unit}"
 
 def get_data_freshness_info():
     """Get information about when data was last updated with real-time calculation"""
+    # The message only changes once a second, so reruns within the same second reuse it
+    return _data_freshness_for_second(int(time.time()), st.session_state.get('last_manual_refresh'))
+
+@functools.lru_cache(maxsize=8)
+def _data_freshness_for_second(current_time, manual_refresh_time):
+    """Build the freshness message for one wall-clock second (stats the data file once)"""
     try:
-        import time
-        import datetime
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        data_path = os.path.join(project_root, "data", "processed", "fpl_players_latest.csv")
-        
-        current_time = time.time()
-        
         # Check if we have a recent manual refresh first (highest priority)
-        if hasattr(st.session_state, 'last_manual_refresh') and st.session_state.last_manual_refresh is not None:
-            manual_refresh_time = st.session_state.last_manual_refresh
+        if manual_refresh_time is not None:
             time_since_manual = current_time - manual_refresh_time
             
             # If manual refresh was less than 10 minutes ago, use that as reference
             if time_since_manual < 600:  # 10 minutes
-                total_seconds = int(time_since_manual)
-                if total_seconds < 60:
-                    return f"🟢 Data is fresh (refreshed {total_seconds}s ago)"
-                else:
-                    minutes = total_seconds // 60
-                    seconds = total_seconds % 60
-                    if seconds > 0:
-                        return f"🟢 Data is fresh (refreshed {minutes}m {seconds}s ago)"
-                    else:
-                        return f"🟢 Data is fresh (refreshed {minutes}m ago)"
-        
-        # Fall back to file timestamp
-        if os.path.exists(data_path):
-            modified_time = os.path.getmtime(data_path)
-            time_diff_seconds = current_time - modified_time
-            total_seconds = int(time_diff_seconds)
-            
-            if total_seconds < 60:  # Less than 1 minute
-                return f"🟢 Data is fresh (updated {total_seconds}s ago)"
-            elif total_seconds < 3600:  # Less than 1 hour
-                minutes = total_seconds // 60
-                seconds = total_seconds % 60
-                if seconds > 0:
-                    return f"🟡 Data is recent (updated {minutes}m {seconds}s ago)"
-                else:
-                    return f"🟡 Data is recent (updated {minutes}m ago)"
-            elif total_seconds < 86400:  # Less than 1 day
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                if minutes > 0:
-                    return f"🔴 Data is stale (updated {hours}h {minutes}m ago)"
-                else:
-                    return f"🔴 Data is stale (updated {hours}h ago)"
-            else:  # More than 1 day
-                days = total_seconds // 86400
-                hours = (total_seconds % 86400) // 3600
-                if hours > 0:
-                    return f"🔴 Data is very stale (updated {days}d {hours}h ago)"
-                else:
-                    return f"🔴 Data is very stale (updated {days}d ago)"
+                return f"🟢 Data is fresh (refreshed {_format_age(int(time_since_manual))} ago)"
+        
+        # Fall back to file timestamp (a single stat)
+        modified_time = _player_data_mtime()
+        if modified_time is not None:
+            total_seconds = int(current_time - modified_time)
+            # Tier index: one step per minute/hour/day threshold passed
+            tier = (total_seconds >= 60) + (total_seconds >= 3600) + (total_seconds >= 86400)
+            return f"{_FRESHNESS_LABELS[tier]} (updated {_format_age(total_seconds)} ago)"
         else:
             return "❌ No data file found"
             
     except Exception as e:
         return f"❓ Could not determine data freshness: {str(e)}"
 
+def load_available_players():
+    """Load player data and filter it to available players in one cached step.
+    
+    Cached per version of the data file: the key is its mtime, so Streamlit does not
+    have to hash the player DataFrame to look up the cached result.
+    """
+    mtime = _player_data_mtime()
+    if mtime is None:
+        return None
+    return _available_players_version(mtime)
+
+@st.cache_data(max_entries=1, show_spinner=False)  # One entry per file version
+def _available_players_version(mtime):
+    """Available players for one version of the data file"""
+    return filter_available_players(_load_player_data_version(_PLAYER_DATA_PATH, mtime))
+
 def filter_available_players(players_df):
     """
     Filter out players who are not available for selection
     
     Args:
-        players_df: Raw player DataFrame
+        players_df: Raw player DataFrame (callers handle a failed load before filtering)
     
     Returns:
         Filtered DataFrame with available players only
     """
-    if players_df is None:
-        return None
-    
-    # Remove players with 0 minutes played and very low ownership (likely not active)
-    inactive_players = players_df[
-        (players_df['minutes'] == 0) & 
-        (players_df['selected_by_percent'] < 0.1) &
-        (players_df['total_points'] == 0)
-    ]
-    
-    if not inactive_players.empty:
-        print(f"[Background] Filtered out {len(inactive_players)} inactive players")
-    
-    players_df = players_df[~(
-        (players_df['minutes'] == 0) & 
-        (players_df['selected_by_percent'] < 0.1) &
-        (players_df['total_points'] == 0)
-    )].copy()
-    
-    return players_df
+    # Remove players with 0 minutes played and very low ownership (likely not active);
+    # compared on the raw arrays so no index-aligned Series temporaries are built
+    inactive_mask = players_df['minutes'].to_numpy() == 0
+    inactive_mask &= players_df['selected_by_percent'].to_numpy() < 0.1
+    inactive_mask &= players_df['total_points'].to_numpy() == 0
+    
+    n_inactive = int(inactive_mask.sum())
+    if not n_inactive:
+        # Typical mid-season: nothing to drop, so skip the boolean slice entirely
+        return players_df
+    print(f"[Background] Filtered out {n_inactive} inactive players")
+    
+    # Boolean indexing already returns a new frame, and load_available_players' cache hands
+    # each caller its own copy, so no extra .copy() is needed
+    return players_df.loc[~inactive_mask]
 
-def apply_custom_css():
-    """Apply custom CSS styling for the FPL app"""
-    st.markdown(f"""
+# App-wide CSS (static, rendered once at import time). It still has to be emitted on
+# every rerun: Streamlit drops elements a script run does not re-send.
+_CUSTOM_CSS = f"""
     <style>
         .stApp {{
             background-color: {FPL_COLORS['background']} !important;
@@ -306,7 +435,35 @@ def apply_custom_css():
             display: none !important;
         }}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def apply_custom_css():
+    """Apply custom CSS styling for the FPL app"""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+# Footer HTML (static, rendered once at import time)
+_FOOTER_DEV_HTML = """
+<div style='text-align: center; color: #666;'>
+    <p><strong>Developed by: Md Ataullah Khan Rifat</strong></p>
+    <p>Built with ❤️ for FPL managers</p>
+    <p><small>Data from official FPL API</small></p>
+</div>
+"""
+
+_FOOTER_DISCLAIMER_HTML = f"""
+<div style='background-color: {FPL_COLORS['sidebar']}; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;'>
+    <h4 style='color: {FPL_COLORS['primary']}; margin-bottom: 0.5rem;'>📢 Disclaimer</h4>
+    <p style='color: #666; font-size: 0.9rem; margin-bottom: 0.5rem;'>
+        <strong>Educational Use Only:</strong> This application is developed for educational and research purposes only.
+    </p>
+    <p style='color: #666; font-size: 0.9rem; margin-bottom: 0.5rem;'>
+        <strong>Data Source:</strong> All player data is sourced from the official Fantasy Premier League API.
+    </p>
+    <p style='color: #666; font-size: 0.9rem; margin-bottom: 0;'>
+        <strong>No Warranty:</strong> Predictions and recommendations are based on statistical models and should be used as guidance only.
+    </p>
+</div>
+"""
 
 def create_footer():
     """Create the shared footer for all pages"""
@@ -315,35 +472,10 @@ def create_footer():
     # Developer info
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.markdown(
-            f"""
-            <div style='text-align: center; color: #666;'>
-                <p><strong>Developed by: Md Ataullah Khan Rifat</strong></p>
-                <p>Built with ❤️ for FPL managers</p>
-                <p><small>Data from official FPL API</small></p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(_FOOTER_DEV_HTML, unsafe_allow_html=True)
     
     # Disclaimer
-    st.markdown(
-        f"""
-        <div style='background-color: {FPL_COLORS['sidebar']}; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;'>
-            <h4 style='color: {FPL_COLORS['primary']}; margin-bottom: 0.5rem;'>📢 Disclaimer</h4>
-            <p style='color: #666; font-size: 0.9rem; margin-bottom: 0.5rem;'>
-                <strong>Educational Use Only:</strong> This application is developed for educational and research purposes only.
-            </p>
-            <p style='color: #666; font-size: 0.9rem; margin-bottom: 0.5rem;'>
-                <strong>Data Source:</strong> All player data is sourced from the official Fantasy Premier League API.
-            </p>
-            <p style='color: #666; font-size: 0.9rem; margin-bottom: 0;'>
-                <strong>No Warranty:</strong> Predictions and recommendations are based on statistical models and should be used as guidance only.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_DISCLAIMER_HTML, unsafe_allow_html=True)
 
 def format_currency(amount, symbol='£'):
     """Format currency values consistently"""
@@ -403,22 +535,35 @@ def validate_data_quality(players_df):
         validation['errors'].append(f"Missing required columns: {missing_columns}")
         validation['data_quality_score'] -= 50
     
-    # Check for missing values in critical columns
-    for col in required_columns:
-        if col in players_df.columns:
-            missing_count = players_df[col].isna().sum()
-            if missing_count > 0:
-                validation['warnings'].append(f"{missing_count} missing values in {col}")
-                validation['data_quality_score'] -= (missing_count / len(players_df)) * 10
+    # Check for missing values in critical columns (one isna().sum() over all of them)
+    present_columns = [col for col in required_columns if col in players_df.columns]
+    missing_counts = players_df[present_columns].isna().sum()
+    for col, missing_count in missing_counts[missing_counts > 0].items():
+        validation['warnings'].append(f"{missing_count} missing values in {col}")
+        validation['data_quality_score'] -= (missing_count / len(players_df)) * 10
     
     # Check for unrealistic values
     if 'cost' in players_df.columns:
-        if players_df['cost'].max() > 20 or players_df['cost'].min() < 3:
+        min_cost, max_cost = players_df['cost'].agg(['min', 'max'])
+        if max_cost > 20 or min_cost < 3:
             validation['warnings'].append("Some player costs seem unrealistic")
             validation['data_quality_score'] -= 5
     
     return validation
 
+def validate_player_data():
+    """Validate the cached player data once per data load.
+    
+    Keyed on the data file's mtime like load_available_players, so reruns hit the
+    cache without hashing the DataFrame.
+    """
+    return _validation_version(_player_data_mtime())
+
+@st.cache_data(max_entries=1, show_spinner=False)  # One entry per file version
+def _validation_version(mtime):
+    """Data quality report for one version of the data file"""
+    return validate_data_quality(_load_player_data_version(_PLAYER_DATA_PATH, mtime))
+
 def setup_page_config():
     """Setup Streamlit page configuration"""
     st.set_page_config(
@@ -428,98 +573,90 @@ def setup_page_config():
         initial_sidebar_state="expanded"
     )
 
+# Session state defaults as (key, factory) pairs, so mutable defaults are only built when missing
+_SESSION_DEFAULTS = (
+    ('selected_players', list),
+    ('optimization_results', lambda: None),
+)
+
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'optimizer'
-    
-    if 'selected_players' not in st.session_state:
-        st.session_state.selected_players = []
+    ss = st.session_state
+    for key, factory in _SESSION_DEFAULTS:
+        if key not in ss:
+            ss[key] = factory()
+
+# Pages reachable through the ?page= query parameter (the first one is the default)
+PAGES = ('optimizer', 'stats', 'fixtures', 'current_season')
+
+def get_current_page():
+    """Return the page selected in the URL query string, falling back to the optimizer"""
+    page = st.query_params.get('page', PAGES[0])
+    return page if page in PAGES else PAGES[0]
+
+def navigate_to(page):
+    """Navigation button callback: switch pages through the URL query string.
     
-    if 'optimization_results' not in st.session_state:
-        st.session_state.optimization_results = None
+    Callbacks run before the rerun the click already triggers, so no extra st.rerun()
+    is needed, and the page survives browser reloads and can be shared as a link.
+    """
+    st.query_params['page'] = page
+    st.session_state.last_user_interaction = time.time()  # Track user interaction
 
 def create_navigation_sidebar():
     """Create the navigation sidebar"""
     st.sidebar.markdown("## 🧭 Navigation")
     
     # Navigation buttons with immediate page switching
-    if st.sidebar.button("🚀 Squad Optimizer", use_container_width=True):
-        st.session_state.current_page = 'optimizer'
-        st.session_state.last_user_interaction = time.time()  # Track user interaction
-        st.rerun()  # Force immediate page change
+    st.sidebar.button("🚀 Squad Optimizer", use_container_width=True, on_click=navigate_to, args=('optimizer',))
     
-    if st.sidebar.button("📊 Player Stats", use_container_width=True):
-        st.session_state.current_page = 'stats'
-        st.session_state.last_user_interaction = time.time()
-        st.rerun()
+    st.sidebar.button("📊 Player Stats", use_container_width=True, on_click=navigate_to, args=('stats',))
     
-    if st.sidebar.button("🗓️ Next 3 Gameweeks", use_container_width=True):
-        st.session_state.current_page = 'fixtures'
-        st.session_state.last_user_interaction = time.time()
-        st.rerun()
+    st.sidebar.button("🗓️ Next 3 Gameweeks", use_container_width=True, on_click=navigate_to, args=('fixtures',))
     
-    if st.sidebar.button("📈 Current Season Points", use_container_width=True):
-        st.session_state.current_page = 'current_season'
-        st.session_state.last_user_interaction = time.time()
-        st.rerun()
+    st.sidebar.button("📈 Current Season Points", use_container_width=True, on_click=navigate_to, args=('current_season',))
     
     st.sidebar.divider()
     
     # Data refresh controls
     st.sidebar.markdown("## 🔄 Data Controls")
     
+    # Pick up a finished background refresh before reporting freshness
+    refresh_finished = _poll_background_refresh()
+    
     # Real-time data freshness indicator
     freshness_info = get_data_freshness_info()
     st.sidebar.markdown(f"**Status:** {freshness_info}")
     
-    # Refresh buttons
-    refresh_clicked = st.sidebar.button("🔄 Refresh Data", use_container_width=True, help="Fetch latest data from FPL API", key="refresh_data_btn")
+    # Refresh buttons (the refresh itself runs in the background; see fetch_fresh_player_data)
+    refresh_running = is_background_refresh_running()
+    cooldown = refresh_cooldown_remaining()
+    refresh_clicked = st.sidebar.button("🔄 Refresh Data", use_container_width=True, help="Fetch latest data from FPL API", key="refresh_data_btn", disabled=refresh_running or cooldown > 0)
     
     if refresh_clicked:
         # Track user interaction to prevent auto-refresh conflicts
         st.session_state.last_user_interaction = time.time()
-        
-        # Clear cache before fetching
-        st.cache_data.clear()
-        
-        # Store refresh time in session state immediately (this will reset the timer)
-        st.session_state.last_manual_refresh = time.time()
-        
-        # Also reset auto-refresh timer to ensure immediate UI update
-        st.session_state.last_auto_refresh = time.time()
-        
-        # Set a flag to indicate refresh is in progress (prevents double execution)
-        if 'refresh_in_progress' not in st.session_state:
-            st.session_state.refresh_in_progress = True
-            
-            # Show immediate feedback
-            with st.spinner("Fetching fresh data from FPL API..."):
-                players_df = fetch_fresh_player_data()
-            
-            if players_df is not None:
-                st.success("✅ Data refreshed successfully!")
-                # Update the loaded data in session state
-                st.session_state.players_df = players_df
+        fetch_fresh_player_data()
+        refresh_running = True
+    
+    if refresh_running:
+        with st.sidebar:
+            _refresh_progress()
+    elif refresh_finished:
+        with st.sidebar:
+            if _refresh_state['error'] is None:
+                _show_refresh_status("✅ Data refreshed successfully!", "complete")
             else:
-                st.error("❌ Failed to refresh data")
-            
-            # Clear the flag
-            del st.session_state.refresh_in_progress
-            
-            # Force immediate rerun to update timestamp
-            st.rerun()
-        else:
-            st.info("🔄 Refresh already in progress, please wait...")
+                _show_refresh_status(f"❌ Data pipeline failed: {_refresh_state['error']}", "error", expanded=True,
+                                     extra_lines=("Please check your internet connection and try again.",))
+    elif cooldown:
+        st.sidebar.caption(f"⏱ Data was just refreshed; you can refresh again in {cooldown}s")
     
     app_refresh_clicked = st.sidebar.button("🔄 Refresh App", use_container_width=True, help="Force refresh all cached data", key="refresh_app_btn")
     
     if app_refresh_clicked:
         st.session_state.last_user_interaction = time.time()
         st.cache_data.clear()
-        # Clear any refresh flags
-        if 'refresh_in_progress' in st.session_state:
-            del st.session_state.refresh_in_progress
         st.rerun()
     
     st.sidebar.divider()
@@ -544,20 +681,15 @@ def format_player_card(player, style="default"):
     Returns:
         HTML string for the player card
     """
-    style_configs = {
-        'forward': {'gradient': 'linear-gradient(90deg, #37003c, #5a0066)', 'text_color': 'white'},
-        'defender': {'gradient': 'linear-gradient(90deg, #00ff87, #04f5ff)', 'text_color': '#37003c'},
-        'midfielder': {'gradient': 'linear-gradient(90deg, #e90052, #ff6b9d)', 'text_color': 'white'},
-        'goalkeeper': {'gradient': 'linear-gradient(90deg, #04f5ff, #00bcd4)', 'text_color': 'white'},
-        'default': {'gradient': 'linear-gradient(90deg, #f0f2f6, #e0e0e0)', 'text_color': '#37003c'}
-    }
-    
-    config = style_configs.get(style, style_configs['default'])
-    
-    return f"""
-    <div style='background: {config["gradient"]}; color: {config["text_color"]}; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;'>
-        <h4 style='margin: 0; color: {config["text_color"]};'>{player['name']}</h4>
-        <p style='margin: 0.2rem 0;'>£{player['cost']:.1f}m | Form: {player.get('form', 0):.1f} | Ownership: {player.get('selected_by_percent', 0):.1f}%</p>
-        <p style='margin: 0.2rem 0; font-size: 0.9em;'>Team: {player['team']} | Points: {player.get('total_points', 0)}</p>
-    </div>
-    """
+    config = _CARD_STYLE_CONFIGS.get(style, _CARD_STYLE_CONFIGS['default'])
+    
+    return _PLAYER_CARD_TEMPLATE.format_map({
+        'gradient': config['gradient'],
+        'text_color': config['text_color'],
+        'name': player['name'],
+        'cost': player['cost'],
+        'form': player.get('form', 0),
+        'ownership': player.get('selected_by_percent', 0),
+        'team': player['team'],
+        'points': player.get('total_points', 0)
+    })